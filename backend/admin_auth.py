@@ -0,0 +1,26 @@
+from fastapi import HTTPException, Request
+import hmac
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+
+async def require_admin(request: Request):
+    """FastAPI dependency guarding routes that change site content.
+
+    The caller must send ADMIN_TOKEN in the ``X-Admin-Token`` header.
+    Without ADMIN_TOKEN configured the guarded routes stay disabled.
+    """
+    expected = os.environ.get("ADMIN_TOKEN", "")
+    if not expected:
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+    supplied = request.headers.get(ADMIN_TOKEN_HEADER)
+    if not supplied:
+        raise HTTPException(status_code=401, detail="Admin token required")
+    if not hmac.compare_digest(supplied.encode(), expected.encode()):
+        client_ip = request.client.host if request.client else "unknown"
+        logger.warning(f"Rejected admin request from {client_ip}: invalid token")
+        raise HTTPException(status_code=403, detail="Invalid admin token")
@@ -0,0 +1,175 @@
+from bson import json_util
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+from database import db_manager
+import asyncio
+import gzip
+import logging
+import os
+import socket
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_MODES = ("off", "collection", "files")
+CLIENT_INFO_FIELDS = ("ipAddress", "userAgent")
+
+
+class ContactArchiver:
+    """Moves old responded contact submissions out of the hot collection.
+
+    ``collection`` copies them into ``contact_submissions_archive``,
+    ``files`` appends them to monthly ``contacts-YYYY-MM.jsonl.gz`` files.
+    A submission is deleted only after its copy is written, so an
+    interrupted run leaves duplicates rather than gaps. Each run moves at
+    most ``max_batches`` batches with ``batch_pause`` seconds between them,
+    so a large backlog is spread over several runs instead of competing
+    with live traffic.
+
+    The background loop holds a MongoDB lease, so with several workers or
+    replicas only one of them runs each pass.
+
+    With ``pii_retention_days`` set, ipAddress/userAgent are also removed
+    from live and archived submissions older than that, and never written
+    to archive files.
+    """
+
+    def __init__(
+        self,
+        database_manager,
+        mode: str = "off",
+        max_age_days: float = 180,
+        batch_size: int = 500,
+        batch_pause: float = 1.0,
+        max_batches: int = 20,
+        interval: float = 3600,
+        archive_dir: Optional[Path] = None,
+        pii_retention_days: float = 0
+    ):
+        if mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unknown archive mode {mode!r}; choose from {', '.join(ARCHIVE_MODES)}")
+        self.database_manager = database_manager
+        self.mode = mode
+        self.max_age = timedelta(days=max_age_days)
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.max_batches = max_batches
+        self.interval = interval
+        self.archive_dir = archive_dir or Path(__file__).parent / "archive"
+        self.pii_retention = timedelta(days=pii_retention_days) if pii_retention_days > 0 else None
+        self.archived = 0
+        self.purged = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        # Only one worker/replica archives at a time
+        self.lease_owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off" or self.pii_retention is not None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.enabled or self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "running": self.running,
+            "archived": self.archived,
+            "purged": self.purged,
+            "lastRunAt": self.last_run_at.isoformat() + "Z" if self.last_run_at else None,
+            "lastError": self.last_error
+        }
+
+    async def run_once(self) -> dict:
+        """One archival pass plus the client-info purge; returns what it did"""
+        now = datetime.utcnow()
+        pii_cutoff = now - self.pii_retention if self.pii_retention else None
+        archived = 0
+        if self.mode != "off":
+            cutoff = now - self.max_age
+            for batch in range(self.max_batches):
+                if batch:
+                    await asyncio.sleep(self.batch_pause)
+                docs = await self.database_manager.get_archivable_contacts(cutoff, self.batch_size)
+                if not docs:
+                    break
+                if pii_cutoff:
+                    for doc in docs:
+                        if doc["submittedAt"] < pii_cutoff:
+                            for field in CLIENT_INFO_FIELDS:
+                                doc.pop(field, None)
+                archived += await self._archive(docs)
+                if len(docs) < self.batch_size:
+                    break
+
+        purged = 0
+        if pii_cutoff:
+            purged = await self.database_manager.purge_contact_client_info(pii_cutoff)
+
+        self.archived += archived
+        self.purged += purged
+        self.last_run_at = now
+        if archived or purged:
+            logger.info(f"Archived {archived} contact submissions, purged client info from {purged}")
+        return {"archived": archived, "purged": purged}
+
+    async def _archive(self, docs: List[dict]) -> int:
+        if self.mode == "files":
+            await asyncio.to_thread(self._write_files, docs)
+            return await self.database_manager.delete_contact_documents([doc["_id"] for doc in docs])
+        return await self.database_manager.archive_contact_documents(docs)
+
+    def _write_files(self, docs: List[dict]):
+        by_month = {}
+        for doc in docs:
+            by_month.setdefault(doc["submittedAt"].strftime("%Y-%m"), []).append(doc)
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        for month, month_docs in by_month.items():
+            # Each append adds a gzip member; gzip readers treat the file as one stream
+            with gzip.open(self.archive_dir / f"contacts-{month}.jsonl.gz", "at", encoding="utf-8") as archive:
+                for doc in month_docs:
+                    archive.write(json_util.dumps(doc) + "\n")
+
+    async def _run(self):
+        while True:
+            try:
+                if await self.database_manager.acquire_lease("contact_archiver", self.lease_owner, self.interval * 2):
+                    await self.run_once()
+                self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = str(e)[:200]
+                logger.error(f"Contact archival failed: {str(e)}")
+            await asyncio.sleep(self.interval)
+
+
+contact_archiver = ContactArchiver(
+    db_manager,
+    mode=os.environ.get("CONTACT_ARCHIVE_MODE", "off"),
+    max_age_days=float(os.environ.get("CONTACT_ARCHIVE_AFTER_DAYS", "180")),
+    batch_size=int(os.environ.get("CONTACT_ARCHIVE_BATCH_SIZE", "500")),
+    batch_pause=float(os.environ.get("CONTACT_ARCHIVE_BATCH_PAUSE", "1.0")),
+    max_batches=int(os.environ.get("CONTACT_ARCHIVE_MAX_BATCHES", "20")),
+    interval=float(os.environ.get("CONTACT_ARCHIVE_INTERVAL_SECONDS", "3600")),
+    archive_dir=Path(os.environ["CONTACT_ARCHIVE_DIR"]) if os.environ.get("CONTACT_ARCHIVE_DIR") else None,
+    pii_retention_days=float(os.environ.get("CONTACT_PII_RETENTION_DAYS", "0"))
+)
@@ -0,0 +1,123 @@
+"""Micro-benchmark: Mongo document -> response dict, per model.
+
+Compares the previous read path (``Model(**doc).dict()``), a single
+``model_validate`` and the trusted-read ``DocumentDecoder`` used by
+DatabaseManager, and checks that all three serialize to the same JSON.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_decoding --docs 5000 --repeat 5
+"""
+from datetime import datetime
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from database import (
+    decode_contact, decode_experience, decode_expertise, decode_profile, decode_testimonial
+)
+from models import ContactSubmission, Experience, ProfileData, Testimonial, TruffleExpertise
+import argparse
+import json
+import time
+
+
+def _contact(i):
+    return {
+        "_id": ObjectId(), "id": f"uuid-{i}", "name": "Jane Doe", "email": f"jane{i}@example.com",
+        "subject": "Partnership inquiry", "message": "Hello Robert, " * 20,
+        "inquiryType": "Business Partnership", "submittedAt": datetime.utcnow(), "status": "new",
+        "ipAddress": "203.0.113.7", "userAgent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0)",
+    }
+
+
+def _profile(i):
+    return {
+        "_id": ObjectId(), "updatedAt": datetime.utcnow(),
+        "personal": {
+            "name": "Robert Chang", "title": "Managing Director", "company": "American Truffle Company",
+            "location": "San Francisco", "summary": "Senior global business leader. " * 5,
+            "languages": ["English", "German", "Mandarin Chinese", "Japanese"],
+            "specialties": ["Market Strategies", "Channel Marketing", "Product Marketing"] * 6,
+        },
+    }
+
+
+def _experience(i):
+    return {
+        "_id": ObjectId(), "company": "American Truffle Company", "position": "Managing Director",
+        "duration": "2007 - Present", "location": "San Francisco, California",
+        "description": "Founded and led innovative truffle cultivation company. " * 3,
+        "achievements": ["Established first commercial truffle cultivation operation"] * 4,
+        "order": i, "isActive": True,
+    }
+
+
+def _testimonial(i):
+    return {
+        "_id": ObjectId(), "name": "Sarah Williams", "title": "Former CEO, TechVentures",
+        "content": "Robert's unique combination of technical expertise and business acumen. " * 2,
+        "avatar": "https://images.unsplash.com/photo-1494790108755?w=400&h=400", "order": i, "isActive": True,
+    }
+
+
+def _expertise(i):
+    return {
+        "_id": ObjectId(), "title": "Truffle Cultivation Innovation", "subtitle": "Pioneering approach",
+        "description": "Combining advanced agricultural science with sustainable practices.",
+        "achievements": ["First commercial truffle cultivation in North America"] * 6,
+        "metrics": [{"label": "Years of Research", "value": "17+"}] * 4, "updatedAt": datetime.utcnow(),
+    }
+
+
+CASES = [
+    ("ContactSubmission", ContactSubmission, decode_contact, _contact),
+    ("ProfileData", ProfileData, decode_profile, _profile),
+    ("Experience", Experience, decode_experience, _experience),
+    ("Testimonial", Testimonial, decode_testimonial, _testimonial),
+    ("TruffleExpertise", TruffleExpertise, decode_expertise, _expertise),
+]
+
+
+def legacy_path(model, doc):
+    doc["id"] = str(doc["_id"])
+    return model(**doc).dict()
+
+
+def validate_path(model, doc):
+    doc["id"] = str(doc["_id"])
+    return model.model_validate(doc).model_dump()
+
+
+def _time(func, docs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        batch = [dict(doc) for doc in docs]
+        start = time.perf_counter()
+        for doc in batch:
+            func(doc)
+        best = min(best, time.perf_counter() - start)
+    return best / len(docs) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'model':<18} {'Model(**doc).dict()':>20} {'model_validate':>15} {'decoder':>10} {'speedup':>8}")
+    for name, model, decoder, factory in CASES:
+        docs = [factory(i) for i in range(args.docs)]
+
+        sample = docs[0]
+        expected = json.dumps(jsonable_encoder(legacy_path(model, dict(sample))), sort_keys=True)
+        actual = json.dumps(jsonable_encoder(decoder(dict(sample))), sort_keys=True)
+        assert expected == actual, f"{name}: decoder output differs from the model path"
+
+        legacy = _time(lambda doc: legacy_path(model, doc), docs, args.repeat)
+        validate = _time(lambda doc: validate_path(model, doc), docs, args.repeat)
+        fast = _time(decoder, docs, args.repeat)
+        print(f"{name:<18} {legacy:>18.2f}us {validate:>13.2f}us {fast:>8.2f}us {legacy / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Cold start benchmark: process spawn -> first successful HTTP response.
+
+Starts ``uvicorn server:app`` in a fresh process on a free port, polls
+``--path`` until it answers 200 and reports the elapsed time. Exits
+non-zero when the median over ``--runs`` exceeds ``--budget-ms``, so it can
+gate deploys. MongoDB doesn't need to be reachable for ``/health``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.bench_startup --runs 5 --budget-ms 2500
+"""
+from pathlib import Path
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_response(path: str, timeout: float) -> float:
+    port = free_port()
+    env = dict(os.environ)
+    env.setdefault("MONGO_URL", "mongodb://127.0.0.1:27017")
+    env.setdefault("DB_NAME", "portfolio_startup_bench")
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    try:
+        url = f"http://127.0.0.1:{port}{path}"
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited early:\n{process.stderr.read().decode()}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                pass
+            time.sleep(0.005)
+        raise RuntimeError(f"no 200 from {path} within {timeout}s")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--path", default="/health")
+    parser.add_argument("--budget-ms", type=float, default=2500)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    samples = []
+    for run in range(1, args.runs + 1):
+        elapsed = time_to_first_response(args.path, args.timeout) * 1000
+        samples.append(elapsed)
+        print(f"run {run}: {elapsed:.0f}ms")
+
+    median = statistics.median(samples)
+    print(f"time to first response ({args.path}): median={median:.0f}ms "
+          f"min={min(samples):.0f}ms max={max(samples):.0f}ms budget={args.budget_ms:.0f}ms")
+    if median > args.budget_ms:
+        print("FAIL: over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+"""Load test for the portfolio API under a mixed read / contact-post workload.
+
+By default the FastAPI app runs in-process over httpx's ASGI transport
+against a mongomock-motor database seeded with realistic content, so no
+MongoDB or network is needed. ``--url`` points the same workload at a
+running server instead. mongomock sorts and filters in Python, so
+``contact_list`` is much slower in-process than against a real MongoDB.
+
+Results (req/s and p50/p95/p99 latency per route) are printed and written
+as JSON so runs can be compared across commits::
+
+    python -m benchmarks.load_test --concurrency 50 --requests 20000
+    python -m benchmarks.load_test --compare benchmarks/results/load_<sha>.json
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# route name -> (method, path, weight); weights model a page-view-heavy site
+DEFAULT_MIX = {
+    "portfolio": 40,
+    "portfolio_revalidate": 20,
+    "experience": 8,
+    "testimonials": 8,
+    "profile": 6,
+    "expertise": 6,
+    "contact_post": 7,
+    "contact_list": 5,
+}
+
+# Routes available to --mix but not in the default workload; /health needs no database,
+# so it isolates server/worker overhead (e.g. comparing launcher settings with --url)
+EXTRA_ROUTES = {"health": "/health"}
+
+CONTACT_BODY = {
+    "name": "Load Tester",
+    "email": "load.tester@example.com",
+    "subject": "Benchmark inquiry",
+    "message": "Just checking how fast this endpoint is under load.",
+    "inquiryType": "Consulting Services",
+}
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition(":")
+        if name.strip() not in DEFAULT_MIX and name.strip() not in EXTRA_ROUTES:
+            choices = ", ".join([*DEFAULT_MIX, *EXTRA_ROUTES])
+            raise argparse.ArgumentTypeError(f"unknown route {name!r}; choose from {choices}")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent, text=True
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+async def seed(db_manager, contacts: int):
+    from models import ContactSubmission, ExperienceCreate, PersonalInfo, ProfileData
+    from models import TestimonialCreate, TruffleExpertiseCreate
+
+    await db_manager.update_profile_data(ProfileData(personal=PersonalInfo(
+        name="Robert Chang", title="Managing Director & Chief Truffle Officer",
+        company="American Truffle Company", location="San Francisco, California",
+        summary="Senior global business leader in technology, truffle cultivation and trade. " * 3,
+        languages=["English", "German", "Mandarin Chinese", "Japanese", "Spanish"],
+        specialties=["Market Strategies", "Channel Marketing", "Product Marketing"] * 6,
+    )))
+    for i in range(8):
+        await db_manager.create_experience(ExperienceCreate(
+            company=f"Company {i}", position="Director of Product Marketing", duration="2007 - 2009",
+            location="Sunnyvale, California", description="Led product marketing initiatives. " * 8,
+            achievements=["Managed product marketing for products serving 500M+ users"] * 4, order=i,
+        ))
+    for i in range(6):
+        await db_manager.create_testimonial(TestimonialCreate(
+            name=f"Reference {i}", title="VP Marketing, Global Corp",
+            content="Working with Robert was transformative for our international markets. " * 3,
+            avatar="https://images.unsplash.com/photo-1438761681033?w=400&h=400", order=i,
+        ))
+    await db_manager.update_truffle_expertise(TruffleExpertiseCreate(
+        title="Truffle Cultivation Innovation", subtitle="Pioneering Scientific Approach",
+        description="Combining advanced agricultural science with sustainable practices. " * 2,
+        achievements=["First commercial truffle cultivation in North America"] * 6,
+        metrics=[{"label": "Years of Research", "value": "17+"}] * 4,
+    ))
+    docs = [
+        ContactSubmission(**CONTACT_BODY, ipAddress="203.0.113.7", userAgent="seed").dict()
+        for _ in range(contacts)
+    ]
+    if docs:
+        await db_manager.insert_contact_documents(docs)
+
+
+class Workload:
+    def __init__(self, client, mix: Dict[str, int]):
+        self.client = client
+        self.routes = list(mix)
+        self.weights = [mix[name] for name in self.routes]
+        self.latencies: Dict[str, List[float]] = {name: [] for name in self.routes}
+        self.errors: Dict[str, int] = {name: 0 for name in self.routes}
+        self.etag: Optional[str] = None
+        self.posted = 0
+
+    async def request(self, name: str):
+        headers = {"accept-encoding": "gzip, br"}
+        if name == "portfolio_revalidate":
+            if self.etag:
+                headers["if-none-match"] = self.etag
+            return await self.client.get("/api/portfolio", headers=headers)
+        if name in EXTRA_ROUTES:
+            return await self.client.get(EXTRA_ROUTES[name], headers=headers)
+        if name == "contact_post":
+            # Distinct messages, or the duplicate filter answers 409
+            self.posted += 1
+            body = {**CONTACT_BODY, "message": f"{CONTACT_BODY['message']} (request {self.posted})"}
+            return await self.client.post("/api/contact", json=body, headers=headers)
+        if name == "contact_list":
+            return await self.client.get("/api/contact", params={"limit": 50}, headers=headers)
+        response = await self.client.get(f"/api/{name}", headers=headers)
+        if name == "portfolio":
+            self.etag = response.headers.get("etag", self.etag)
+        return response
+
+    async def worker(self, remaining: List[int], rng: random.Random):
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            name = rng.choices(self.routes, self.weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await self.request(name)
+                ok = response.status_code < 400
+            except Exception:
+                ok = False
+            self.latencies[name].append(time.perf_counter() - start)
+            if not ok:
+                self.errors[name] += 1
+
+
+def summarize(workload: Workload, elapsed: float) -> dict:
+    routes = {}
+    for name, samples in workload.latencies.items():
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        routes[name] = {
+            "requests": len(samples),
+            "errors": workload.errors[name],
+            "rps": round(len(samples) / elapsed, 2),
+            "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+            "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+            "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+            "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        }
+    everything = sorted(s for samples in workload.latencies.values() for s in samples)
+    return {
+        "total": {
+            "requests": len(everything),
+            "errors": sum(workload.errors.values()),
+            "rps": round(len(everything) / elapsed, 2),
+            "p50_ms": round(percentile(everything, 50) * 1000, 3),
+            "p95_ms": round(percentile(everything, 95) * 1000, 3),
+            "p99_ms": round(percentile(everything, 99) * 1000, 3),
+            "elapsed_s": round(elapsed, 3),
+        },
+        "routes": routes,
+    }
+
+
+async def run(args) -> dict:
+    import httpx
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=30)
+        app = None
+    else:
+        # Let the workload post contacts without tripping the per-IP limit
+        os.environ.setdefault("RATE_LIMIT_CONTACT", "1000000000/3600")
+        from mongomock_motor import AsyncMongoMockClient
+        from database import db_manager
+        from server import app
+
+        db_manager.client = AsyncMongoMockClient()
+        db_manager._db = db_manager.client["portfolio_benchmark"]
+        await seed(db_manager, args.seed_contacts)
+        await app.router.startup()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+    workload = Workload(client, args.mix)
+    rng = random.Random(args.seed)
+    try:
+        # Warm caches and connections before measuring
+        for name in workload.routes:
+            await workload.request(name)
+
+        remaining = [args.requests]
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            workload.worker(remaining, random.Random(rng.random())) for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.aclose()
+        if app is not None:
+            await app.router.shutdown()
+
+    return {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "target": args.url or "in-process (mongomock-motor)",
+        "python": platform.python_version(),
+        "concurrency": args.concurrency,
+        "mix": args.mix,
+        **summarize(workload, elapsed),
+    }
+
+
+def print_report(result: dict, baseline: Optional[dict] = None):
+    print(f"commit {result['commit']}  target {result['target']}  concurrency {result['concurrency']}")
+    header = f"{'route':<22} {'reqs':>7} {'err':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    if baseline:
+        header += f" {'Δp95':>8} {'Δreq/s':>8}"
+    print(header)
+    rows = list(result["routes"].items()) + [("TOTAL", result["total"])]
+    for name, stats in rows:
+        line = (
+            f"{name:<22} {stats['requests']:>7} {stats['errors']:>5} {stats['rps']:>9.1f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+        before = baseline.get("routes", {}).get(name) if baseline else None
+        if baseline and name == "TOTAL":
+            before = baseline.get("total")
+        if before:
+            line += (
+                f" {(stats['p95_ms'] / before['p95_ms'] - 1) * 100 if before['p95_ms'] else 0:>+7.1f}%"
+                f" {(stats['rps'] / before['rps'] - 1) * 100 if before['rps'] else 0:>+7.1f}%"
+            )
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the portfolio API")
+    parser.add_argument("--url", help="Target a running server instead of the in-process app")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX),
+                        help="Weighted routes, e.g. portfolio:5,contact_post:1")
+    parser.add_argument("--seed-contacts", type=int, default=2000,
+                        help="Contact submissions seeded into the in-process database")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed for the request mix")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/load_<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to diff against")
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.INFO)
+
+    result = asyncio.run(run(args))
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_report(result, baseline)
+
+    output = args.output or RESULTS_DIR / f"load_{result['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"Results written to {output}")
+    return 1 if result["total"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+from pathlib import Path
+from dotenv import load_dotenv
+import asyncio
+import statistics
+import time
+import typer
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+app = typer.Typer(help="Robert Chang Portfolio API management commands")
+
+
+@app.callback()
+def main():
+    """Robert Chang Portfolio API management commands"""
+
+
+@app.command()
+def serve(
+    host: str = typer.Option(None, help="Bind address (HOST, default 0.0.0.0)"),
+    port: int = typer.Option(None, help="Port (PORT, default 8001)"),
+    workers: int = typer.Option(None, help="Worker processes (WEB_CONCURRENCY, default one per CPU)"),
+    loop: str = typer.Option(None, help="auto | uvloop | asyncio (UVICORN_LOOP)"),
+    http: str = typer.Option(None, help="auto | httptools | h11 (UVICORN_HTTP)"),
+    keep_alive: float = typer.Option(None, help="Idle keep-alive seconds (KEEP_ALIVE_SECONDS, default 65)"),
+    backlog: int = typer.Option(None, help="Listen backlog (BACKLOG, default 2048)"),
+):
+    """Run the API with production settings (multi-worker, uvloop/httptools when installed)."""
+    from launcher import serve as run_server
+
+    run_server(host=host, port=port, workers=workers, loop=loop, http=http, keep_alive=keep_alive, backlog=backlog)
+
+
+@app.command()
+def snapshot(
+    out: Path = typer.Option(ROOT_DIR / "snapshots", help="Directory to write snapshots into"),
+    offline: bool = typer.Option(False, help="Skip MongoDB and snapshot the built-in default content"),
+    bench: int = typer.Option(0, help="Rebuild the snapshot N extra times and report timings"),
+):
+    """Export all portfolio content to versioned, precompressed JSON files."""
+    from database import db_manager
+    from snapshot import build_snapshot
+
+    async def run():
+        try:
+            manifest = await build_snapshot(out, offline=offline)
+            runs = []
+            for _ in range(bench):
+                # Drop cached content so every run measures a full read
+                db_manager.invalidate_content()
+                start = time.perf_counter()
+                await build_snapshot(out, offline=offline)
+                runs.append((time.perf_counter() - start) * 1000)
+            return manifest, runs
+        finally:
+            await db_manager.close()
+
+    manifest, runs = asyncio.run(run())
+    typer.echo(f"Snapshot {manifest['version']} written to {out / manifest['path']}")
+    for section, info in manifest["files"].items():
+        sizes = ", ".join(f"{kind}={size}B" for kind, size in info["sizes"].items())
+        typer.echo(f"  {section}: {sizes}")
+    phases = ", ".join(f"{phase}={ms}ms" for phase, ms in manifest["timings"].items())
+    typer.echo(f"First build: {phases}")
+    if runs:
+        typer.echo(
+            f"Benchmark ({len(runs)} runs): mean={statistics.mean(runs):.2f}ms "
+            f"min={min(runs):.2f}ms max={max(runs):.2f}ms"
+        )
+
+
+
+@app.command()
+def archive(
+    mode: str = typer.Option(None, help="collection or files (default: CONTACT_ARCHIVE_MODE)"),
+):
+    """Run one contact archival and client-info purge pass now."""
+    from database import db_manager
+    from archival import ARCHIVE_MODES, contact_archiver
+
+    if mode and mode not in ARCHIVE_MODES:
+        raise typer.BadParameter(f"choose from {', '.join(ARCHIVE_MODES)}", param_hint="--mode")
+    if mode:
+        contact_archiver.mode = mode
+    if not contact_archiver.enabled:
+        raise typer.BadParameter("set --mode or CONTACT_ARCHIVE_MODE / CONTACT_PII_RETENTION_DAYS", param_hint="--mode")
+
+    async def run():
+        try:
+            return await contact_archiver.run_once()
+        finally:
+            await db_manager.close()
+
+    result = asyncio.run(run())
+    typer.echo(f"Archived {result['archived']} submissions ({contact_archiver.mode}), "
+               f"purged client info from {result['purged']}")
+
+
+
+@app.command("import-profile")
+def import_profile(
+    module: str = typer.Option("server", help="Module to import, as the API process does"),
+    top: int = typer.Option(15, help="How many packages and modules to list"),
+    budget_ms: float = typer.Option(0, help="Exit non-zero when the total import time exceeds this"),
+):
+    """Report where import time goes when the API process starts (python -X importtime)."""
+    import subprocess
+    import sys
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    if result.returncode != 0 or not modules:
+        typer.echo(result.stderr[-2000:], err=True)
+        raise typer.Exit(1)
+
+    packages = {}
+    for name, self_us, _ in modules:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    total_ms = next((cumulative for name, _, cumulative in modules if name == module), 0) / 1000
+
+    typer.echo(f"import {module}: {total_ms:.1f}ms across {len(modules)} modules")
+    typer.echo("\nBy top-level package (self time):")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        typer.echo(f"  {self_us / 1000:8.1f}ms  {package}")
+    typer.echo("\nSlowest modules (self time):")
+    for name, self_us, cumulative_us in sorted(modules, key=lambda item: -item[1])[:top]:
+        typer.echo(f"  {self_us / 1000:8.1f}ms  {name}  (cumulative {cumulative_us / 1000:.1f}ms)")
+
+    if budget_ms and total_ms > budget_ms:
+        typer.echo(f"\nImport time {total_ms:.1f}ms is over the {budget_ms:.0f}ms budget", err=True)
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
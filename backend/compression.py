@@ -0,0 +1,19 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+HAS_BROTLI = brotli is not None
+
+
+def gzip_bytes(data: bytes, level: int = 9) -> bytes:
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def brotli_bytes(data: bytes, quality: int = 11) -> bytes:
+    if brotli is None:
+        raise RuntimeError("brotli is not installed")
+    return brotli.compress(data, quality=quality, mode=brotli.MODE_TEXT)
@@ -0,0 +1,271 @@
+from bson import ObjectId, json_util
+from contextlib import contextmanager
+from pathlib import Path
+from pymongo.errors import BulkWriteError
+from typing import Callable, List, Optional
+from database import db_manager, DUPLICATE_KEY_ERROR
+from models import ContactSubmission
+from spam_filter import DuplicateSubmissionError
+import asyncio
+import logging
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-process development only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when the write-behind queue stays full for longer than the put timeout"""
+
+
+class ContactWriteQueue:
+    """Write-behind queue for contact submissions.
+
+    ``submit`` assigns the Mongo ``_id`` up front, so the caller gets its id
+    without waiting on the database. A background task flushes queued
+    documents with ``insert_many`` in batches. A batch that still fails
+    after its retries is appended to a local JSONL spill file. That file is
+    replayed on the next successful flush or at startup. Workers sharing a
+    spill file take an exclusive lock on ``<spill>.lock`` while appending or
+    claiming it, so only one of them replays each spilled document.
+    """
+
+    def __init__(
+        self,
+        database_manager,
+        maxsize: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        put_timeout: float = 2.0,
+        max_attempts: int = 3,
+        spill_path: Optional[Path] = None
+    ):
+        self.database_manager = database_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_attempts = max_attempts
+        self.spill_path = spill_path or Path(__file__).parent / "contact_spill.jsonl"
+        self.maxsize = maxsize
+        # Called with each batch once it is stored, e.g. to send notifications
+        self.listeners: List[Callable[[List[dict]], None]] = []
+        # Created in start() so it binds to the serving event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running:
+            return
+        await self._replay_spill()
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._task = asyncio.create_task(self._run())
+
+    async def submit(self, submission: ContactSubmission, fingerprint: Optional[str] = None) -> str:
+        doc = submission.dict()
+        doc["_id"] = ObjectId()
+        if fingerprint:
+            doc["fingerprint"] = fingerprint
+
+        if not self.running:
+            # No background writer (e.g. scripts): write through
+            if not await self._insert([doc]):
+                raise DuplicateSubmissionError("This message was already submitted")
+            return str(doc["_id"])
+
+        try:
+            # Common case: room in the queue, no need to schedule a wait_for task
+            self._queue.put_nowait(doc)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(doc), timeout=self.put_timeout)
+            except asyncio.TimeoutError:
+                raise QueueFullError("Contact submission queue is full")
+        return str(doc["_id"])
+
+    async def drain(self, timeout: float = 10.0):
+        """Flush everything still queued and stop the background writer.
+
+        Whatever cannot be written within ``timeout`` seconds is spilled to disk.
+        """
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out draining contact submissions, spilling the remainder")
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+            self._queue.task_done()
+        if remaining:
+            self._append_spill(remaining)
+            logger.warning(f"Spilled {len(remaining)} queued contact submissions on shutdown")
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "maxSize": self.maxsize,
+            "running": self.running,
+            "spilled": self.spill_path.exists() and self.spill_path.stat().st_size > 0
+        }
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._flush(batch)
+            except asyncio.CancelledError:
+                self._append_spill(batch)
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error flushing contact submissions: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, docs: List[dict]):
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self._insert(docs)
+                break
+            except Exception as e:
+                logger.warning(f"Contact batch insert failed (attempt {attempt}/{self.max_attempts}): {str(e)}")
+                if attempt < self.max_attempts:
+                    await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+        else:
+            await asyncio.to_thread(self._append_spill, docs)
+            logger.error(f"Spilled {len(docs)} contact submissions to {self.spill_path}")
+            return
+
+        if self.spill_path.exists():
+            await self._replay_spill()
+
+    async def _insert(self, docs: List[dict]) -> List[dict]:
+        """Insert a batch and return the documents that are now stored.
+
+        Listeners only hear about documents this call inserted, not ones an
+        earlier attempt or replay already stored (and already announced).
+        """
+        try:
+            await self.database_manager.insert_contact_documents(docs)
+            inserted = docs
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                raise
+            # An _id clash means an earlier partial attempt or replay already
+            # stored the document; a fingerprint clash is a resubmitted message
+            # another process accepted first, which is dropped.
+            rejected = {
+                error["index"] for error in errors
+                if "fingerprint" in (error.get("keyPattern") or {}) or "fingerprint" in error.get("errmsg", "")
+            }
+            if rejected:
+                logger.info(f"Dropped {len(rejected)} duplicate contact submissions")
+            failed = {error["index"] for error in errors}
+            inserted = [doc for index, doc in enumerate(docs) if index not in failed]
+            docs = [doc for index, doc in enumerate(docs) if index not in rejected]
+        self._notify(inserted)
+        return docs
+
+    def _notify(self, docs: List[dict]):
+        if not docs:
+            return
+        for listener in self.listeners:
+            try:
+                listener(docs)
+            except Exception as e:
+                logger.error(f"Contact submission listener failed: {str(e)}")
+
+    @contextmanager
+    def _spill_lock(self):
+        """Exclusive lock shared by every process using this spill path; released on exit or crash"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.spill_path.with_suffix(".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _append_spill(self, docs: List[dict]):
+        with self._spill_lock(), open(self.spill_path, "a", encoding="utf-8") as spill:
+            for doc in docs:
+                spill.write(json_util.dumps(doc) + "\n")
+
+    def _take_spill(self) -> List[dict]:
+        replay_path = self.spill_path.with_suffix(".replay")
+        with self._spill_lock():
+            try:
+                if replay_path.exists():
+                    # Left over from a replay interrupted by a crash
+                    with open(self.spill_path, encoding="utf-8") as spill, open(replay_path, "a", encoding="utf-8") as replay:
+                        replay.write(spill.read())
+                    self.spill_path.unlink()
+                else:
+                    self.spill_path.replace(replay_path)
+            except FileNotFoundError:
+                # No new spill; possibly only a leftover replay file
+                pass
+            try:
+                with open(replay_path, encoding="utf-8") as spill:
+                    docs = [json_util.loads(line) for line in spill if line.strip()]
+            except FileNotFoundError:
+                return []
+            replay_path.unlink()
+        return docs
+
+    async def _replay_spill(self):
+        try:
+            docs = await asyncio.to_thread(self._take_spill)
+        except OSError as e:
+            # Never fail startup over the spill file; it is retried on the next flush
+            logger.error(f"Could not read spilled contact submissions: {str(e)}")
+            return
+        if not docs:
+            return
+        try:
+            for start in range(0, len(docs), self.batch_size):
+                await self._insert(docs[start:start + self.batch_size])
+            logger.info(f"Replayed {len(docs)} spilled contact submissions")
+        except Exception as e:
+            # Put them back; duplicates from the partial replay are ignored next time
+            await asyncio.to_thread(self._append_spill, docs)
+            logger.error(f"Could not replay spilled contact submissions: {str(e)}")
+
+
+contact_queue = ContactWriteQueue(
+    db_manager,
+    maxsize=int(os.environ.get("CONTACT_QUEUE_MAXSIZE", "1000")),
+    batch_size=int(os.environ.get("CONTACT_QUEUE_BATCH_SIZE", "100")),
+    flush_interval=float(os.environ.get("CONTACT_QUEUE_FLUSH_INTERVAL", "0.5")),
+    put_timeout=float(os.environ.get("CONTACT_QUEUE_PUT_TIMEOUT", "2.0")),
+    spill_path=Path(os.environ["CONTACT_SPILL_PATH"]) if os.environ.get("CONTACT_SPILL_PATH") else None
+)
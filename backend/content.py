@@ -0,0 +1,215 @@
+from typing import Awaitable, Callable, Dict, Tuple
+import asyncio
+from database import db_manager
+from metrics import content_fallbacks_total
+from responses import RenderedContent, render_success
+
+# Fallback content served when the database has not been seeded yet.
+# Built once at import time and shared by every request.
+
+DEFAULT_PROFILE = {
+    "personal": {
+        "name": "Robert Chang",
+        "title": "Managing Director & Chief Truffle Officer",
+        "company": "American Truffle Company",
+        "location": "San Francisco, California, United States",
+        "summary": "Senior global business leader in technology, truffle cultivation and trade. Results-driven Stanford MBA with extensive general management experience and technical background. Fluent in English, German, Mandarin Chinese and Japanese.",
+        "languages": ["English", "German", "Mandarin Chinese", "Japanese", "Spanish"],
+        "specialties": [
+            "Market Strategies", "Channel Marketing", "Product Marketing", "Business Development",
+            "Advertising", "Pricing", "Sales Promotions", "Distribution", "Corporate Communications",
+            "Alliance/Partnerships", "Contract Negotiations", "Sales Development", "Cross-cultural Teams",
+            "Team Leadership", "Marketing Management", "Mobile and Wireless", "Branding", "Lead Generation"
+        ]
+    }
+}
+
+DEFAULT_EXPERIENCES = [
+    {
+        "id": "1",
+        "company": "American Truffle Company",
+        "position": "Managing Director & Chief Truffle Officer",
+        "duration": "December 2007 - Present (17 years)",
+        "location": "San Francisco, California",
+        "description": "Founded and led innovative truffle cultivation company, developing scientific methods to grow European truffles sustainably. Pioneered ultra-fresh truffle distribution globally.",
+        "achievements": [
+            "Established first commercial truffle cultivation operation in North America",
+            "Developed proprietary scientific methods for truffle cultivation",
+            "Built global distribution network for ultra-fresh truffles",
+            "Led company to profitability within 3 years"
+        ],
+        "order": 0,
+        "isActive": True
+    },
+    {
+        "id": "2",
+        "company": "ActionRun, Inc.",
+        "position": "VP of Marketing; CEO",
+        "duration": "2010 - 2013 (3 years)",
+        "location": "Silicon Valley, California",
+        "description": "Led marketing strategy and later served as CEO for mobile technology startup.",
+        "achievements": [
+            "Grew user base by 400% in first year as VP Marketing",
+            "Successfully transitioned to CEO role during critical growth phase",
+            "Secured Series A funding of $5M",
+            "Established partnerships with major mobile carriers"
+        ],
+        "order": 1,
+        "isActive": True
+    },
+    {
+        "id": "3",
+        "company": "Yahoo!",
+        "position": "Director of Product Marketing",
+        "duration": "October 2007 - February 2009 (1 year 5 months)",
+        "location": "Sunnyvale, California",
+        "description": "Led product marketing initiatives for Yahoo's core products during critical transformation period.",
+        "achievements": [
+            "Managed product marketing for products serving 500M+ users",
+            "Led cross-functional teams across multiple time zones",
+            "Developed go-to-market strategies for mobile products",
+            "Improved user engagement metrics by 35%"
+        ],
+        "order": 2,
+        "isActive": True
+    }
+]
+
+DEFAULT_TESTIMONIALS = [
+    {
+        "id": "1",
+        "name": "Sarah Williams",
+        "title": "Former CEO, TechVentures",
+        "content": "Robert's unique combination of technical expertise and business acumen is extraordinary. His ability to bridge cultures and markets made him invaluable to our global expansion.",
+        "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=400&h=400&fit=crop&crop=face",
+        "order": 0,
+        "isActive": True
+    },
+    {
+        "id": "2",
+        "name": "Dr. Marcus Chen",
+        "title": "Research Director, Agricultural Sciences",
+        "content": "Robert's innovative approach to truffle cultivation has revolutionized the industry. His scientific rigor combined with business vision is truly remarkable.",
+        "avatar": "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=400&h=400&fit=crop&crop=face",
+        "order": 1,
+        "isActive": True
+    },
+    {
+        "id": "3",
+        "name": "Lisa Park",
+        "title": "VP Marketing, Global Corp",
+        "content": "Working with Robert at Yahoo was transformative. His cross-cultural leadership and strategic thinking helped us navigate complex international markets successfully.",
+        "avatar": "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=400&h=400&fit=crop&crop=face",
+        "order": 2,
+        "isActive": True
+    }
+]
+
+DEFAULT_EXPERTISE = {
+    "title": "Truffle Cultivation Innovation",
+    "subtitle": "Pioneering Scientific Approach to European Truffle Cultivation",
+    "description": "Combining advanced agricultural science with sustainable practices to revolutionize truffle cultivation in North America.",
+    "achievements": [
+        "First commercial truffle cultivation in North America",
+        "Proprietary soil microbiome optimization techniques",
+        "Sustainable harvesting methods preserving ecosystem",
+        "Global distribution of ultra-fresh truffles within 48 hours",
+        "Partnership with Michelin-starred restaurants worldwide",
+        "Scientific publications on truffle mycorrhizal relationships"
+    ],
+    "metrics": [
+        {"label": "Years of Research", "value": "17+"},
+        {"label": "Truffle Varieties", "value": "8"},
+        {"label": "Global Partners", "value": "50+"},
+        {"label": "Harvest Success Rate", "value": "95%"}
+    ]
+}
+
+
+async def load_profile():
+    profile = await db_manager.get_profile_document()
+    if not profile:
+        return DEFAULT_PROFILE
+    return profile
+
+
+async def load_experiences():
+    experiences = await db_manager.get_experience_documents()
+    if not experiences:
+        return DEFAULT_EXPERIENCES
+    return experiences
+
+
+async def load_testimonials():
+    testimonials = await db_manager.get_testimonial_documents()
+    if not testimonials:
+        return DEFAULT_TESTIMONIALS
+    return testimonials
+
+
+async def load_expertise():
+    expertise = await db_manager.get_truffle_expertise_document()
+    if not expertise:
+        return DEFAULT_EXPERTISE
+    return expertise
+
+
+async def load_portfolio():
+    """Fetch every section concurrently for the single-request page load"""
+    profile, experiences, testimonials, expertise = await asyncio.gather(
+        load_profile(),
+        load_experiences(),
+        load_testimonials(),
+        load_expertise()
+    )
+    return {
+        "profile": profile,
+        "experience": experiences,
+        "testimonials": testimonials,
+        "expertise": expertise
+    }
+
+
+# Section name -> built-in default, to spot fallbacks in a rendered payload
+FALLBACKS = {
+    "profile": DEFAULT_PROFILE,
+    "experience": DEFAULT_EXPERIENCES,
+    "testimonials": DEFAULT_TESTIMONIALS,
+    "expertise": DEFAULT_EXPERTISE,
+}
+
+# Section name -> (loader, success message)
+SECTIONS: Dict[str, Tuple[Callable[[], Awaitable], str]] = {
+    "profile": (load_profile, "Profile data retrieved successfully"),
+    "experience": (load_experiences, "Experience data retrieved successfully"),
+    "testimonials": (load_testimonials, "Testimonials retrieved successfully"),
+    "expertise": (load_expertise, "Expertise data retrieved successfully"),
+    "portfolio": (load_portfolio, "Portfolio data retrieved successfully"),
+}
+
+
+def _fallback_sections(section: str, data) -> Tuple[str, ...]:
+    """Names of the sections in ``data`` that are the built-in defaults"""
+    parts = data if section == "portfolio" else {section: data}
+    return tuple(name for name, value in parts.items() if value is FALLBACKS[name])
+
+
+async def get_rendered_section(section: str) -> RenderedContent:
+    """Return the serialized response for a content section.
+
+    The bytes live in the same cache as the content itself, so they are
+    rebuilt only when DatabaseManager invalidates content or the TTL expires.
+    Every response served from the defaults is counted, cached or not.
+    """
+    loader, message = SECTIONS[section]
+
+    async def render():
+        data = await loader()
+        rendered = render_success(data, message)
+        rendered.fallbacks = _fallback_sections(section, data)
+        return rendered
+
+    rendered = await db_manager.content_cache.get_or_load(("response", section), render)
+    for fallback in rendered.fallbacks:
+        content_fallbacks_total.inc(section=fallback)
+    return rendered
@@ -0,0 +1,135 @@
+from pymongo.errors import OperationFailure
+from typing import Optional
+from database import db_manager
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+CONTENT_COLLECTIONS = ("profile_data", "experiences", "testimonials", "truffle_expertise")
+WATCH_MODES = ("auto", "changestream", "poll", "off")
+
+
+class ContentWatcher:
+    """Drops this process's cached content when another replica edits it.
+
+    ``changestream`` watches the content collections and invalidates on
+    every change. ``poll`` compares the shared content version bumped by
+    ``DatabaseManager.content_changed`` every ``poll_interval`` seconds.
+    ``auto`` tries change streams first and falls back to polling when the
+    stream can't be opened (e.g. a standalone server without an oplog).
+    """
+
+    def __init__(self, database_manager, mode: str = "auto", poll_interval: float = 5.0):
+        if mode not in WATCH_MODES:
+            raise ValueError(f"Unknown content watch mode {mode!r}; choose from {', '.join(WATCH_MODES)}")
+        self.database_manager = database_manager
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.active_mode: Optional[str] = None
+        self.invalidations = 0
+        self._seen_version: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if self.mode == "off" or self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.active_mode = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "activeMode": self.active_mode,
+            "running": self.running,
+            "invalidations": self.invalidations
+        }
+
+    def _invalidate(self, reason: str):
+        self.invalidations += 1
+        self.database_manager.invalidate_content()
+        logger.info(f"Content cache invalidated by {reason}")
+
+    async def _run(self):
+        if self.mode in ("auto", "changestream"):
+            try:
+                await self._watch()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Polling works on every topology, so auto mode never gives up on invalidation
+                if self.mode == "changestream":
+                    logger.error(f"Change streams unavailable, content watcher stopped: {str(e)}")
+                    return
+                logger.info(f"Change streams unavailable, polling content version instead: {str(e)}")
+        await self._poll()
+
+    async def _watch(self):
+        pipeline = [{"$match": {"ns.coll": {"$in": list(CONTENT_COLLECTIONS)}}}]
+        resume_token = None
+        delay = 1.0
+        while True:
+            try:
+                async with self.database_manager.db.watch(pipeline, resume_after=resume_token) as stream:
+                    self.active_mode = "changestream"
+                    if resume_token is None:
+                        # Anything written before the stream opened is unseen
+                        self._invalidate("change stream (re)start")
+                    delay = 1.0
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        self._invalidate(f"{change['operationType']} on {change['ns']['coll']}")
+            except OperationFailure:
+                if self.active_mode is None:
+                    raise
+                # e.g. the resume token fell off the oplog: start over from now
+                logger.warning(f"Content change stream could not resume, reopening in {delay:.0f}s")
+                resume_token = None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.active_mode is None:
+                    raise
+                logger.warning(f"Content change stream interrupted, retrying in {delay:.0f}s: {str(e)}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 60.0)
+
+    async def _poll(self):
+        self.active_mode = "poll"
+        while True:
+            try:
+                version = await self.database_manager.get_content_version()
+                if self._seen_version is not None and version != self._seen_version \
+                        and version != self.database_manager.content_version:
+                    self._invalidate(f"content version {version}")
+                self._seen_version = version
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Could not poll content version: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+
+content_watcher = ContentWatcher(
+    db_manager,
+    mode=os.environ.get("CONTENT_WATCH_MODE", "auto"),
+    poll_interval=float(os.environ.get("CONTENT_WATCH_POLL_SECONDS", "5"))
+)
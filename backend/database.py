@@ -1,5 +1,11 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import List, Optional
+from bson import ObjectId
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from typing import AsyncIterator, List, Optional, Tuple
+import asyncio
+import base64
+import json
 import os
 from dotenv import load_dotenv
 
@@ -7,22 +13,170 @@ from dotenv import load_dotenv
 load_dotenv()
 from models import (
     ContactSubmission, ContactSubmissionCreate, ProfileData, PersonalInfo,
-    Experience, ExperienceCreate, Testimonial, TestimonialCreate,
-    TruffleExpertise, TruffleExpertiseCreate
+    Experience, ExperienceCreate, ExperienceBulkRequest, Testimonial, TestimonialCreate,
+    TestimonialBulkRequest, TruffleExpertise, TruffleExpertiseCreate,
+    InquiryType, SubmissionStatus
 )
-from datetime import datetime
+from cache import TTLCache
+from indexes import ensure_indexes, check_query_plans
+from metrics import instrument_db
+from health import pool_monitor
+from decoding import DocumentDecoder
+from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 
+DUPLICATE_KEY_ERROR = 11000
+
+# Fields a contact listing may be projected down to
+CONTACT_FIELDS = tuple(ContactSubmission.model_fields)
+
+# $dateToString formats for contact stats timeline buckets (ISO weeks for "week")
+STATS_BUCKETS = {"day": "%Y-%m-%d", "week": "%G-W%V"}
+
+# Trusted-read decoders: Mongo document -> response-ready dict without a model round trip
+decode_contact = DocumentDecoder(ContactSubmission)
+decode_profile = DocumentDecoder(ProfileData)
+decode_experience = DocumentDecoder(Experience)
+decode_testimonial = DocumentDecoder(Testimonial)
+decode_expertise = DocumentDecoder(TruffleExpertise)
+
+def _object_id(value: str):
+    """Mongo-assigned ids are ObjectIds; accept their string form and pass anything else through"""
+    return ObjectId(value) if ObjectId.is_valid(value) else value
+
+def _encode_cursor(doc: dict) -> str:
+    """Opaque keyset cursor for the (submittedAt, _id) position of a document"""
+    position = {"t": doc["submittedAt"].isoformat(), "i": str(doc["_id"])}
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, object]:
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        submitted_at = datetime.fromisoformat(position["t"])
+        doc_id = position["i"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return submitted_at, _object_id(doc_id)
+
+def _client_options() -> dict:
+    """Motor client settings from the environment; unset values keep driver defaults"""
+    options = {
+        "maxPoolSize": int(os.environ.get('MONGO_MAX_POOL_SIZE', '100')),
+        "minPoolSize": int(os.environ.get('MONGO_MIN_POOL_SIZE', '0')),
+        "serverSelectionTimeoutMS": int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000')),
+        "connectTimeoutMS": int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', '5000')),
+        "readPreference": os.environ.get('MONGO_READ_PREFERENCE', 'primary'),
+        "event_listeners": [pool_monitor],
+    }
+    if os.environ.get('MONGO_WAIT_QUEUE_TIMEOUT_MS'):
+        options["waitQueueTimeoutMS"] = int(os.environ['MONGO_WAIT_QUEUE_TIMEOUT_MS'])
+    if os.environ.get('MONGO_MAX_IDLE_TIME_MS'):
+        options["maxIdleTimeMS"] = int(os.environ['MONGO_MAX_IDLE_TIME_MS'])
+    if os.environ.get('MONGO_COMPRESSORS'):
+        # e.g. "zstd,snappy,zlib"; zstd and snappy need their optional packages
+        options["compressors"] = os.environ['MONGO_COMPRESSORS']
+    return options
+
+def _contact_filter(status: Optional[str] = None, inquiry_type: Optional[str] = None) -> dict:
+    query = {}
+    if status:
+        query["status"] = status
+    if inquiry_type:
+        query["inquiryType"] = inquiry_type
+    return query
+
+@instrument_db
 class DatabaseManager:
     def __init__(self):
-        mongo_url = os.environ['MONGO_URL']
-        self.client = AsyncIOMotorClient(mongo_url)
-        self.db = self.client[os.environ['DB_NAME']]
+        # The Motor client is created in connect(), normally from the app's startup hook
+        self.client: Optional[AsyncIOMotorClient] = None
+        self._db = None
+        # Read-through cache for the public portfolio content
+        self.content_cache = TTLCache(
+            ttl=float(os.environ.get('CONTENT_CACHE_TTL', '300')),
+            max_entries=int(os.environ.get('CONTENT_CACHE_MAX_ENTRIES', '64'))
+        )
+        # Short-lived cache for contact statistics aggregations
+        self.stats_cache = TTLCache(
+            ttl=float(os.environ.get('CONTACT_STATS_CACHE_SECONDS', '30')),
+            max_entries=32
+        )
+        # Last content version this process wrote, so the poller skips its own bumps
+        self.content_version: Optional[int] = None
         
+    def connect(self):
+        """Create the Motor client; connections are opened lazily or by warm_up()"""
+        if self.client is None:
+            self.client = AsyncIOMotorClient(os.environ['MONGO_URL'], **_client_options())
+            self._db = self.client[os.environ['DB_NAME']]
+        return self.client
+
+    @property
+    def db(self):
+        if self._db is None:
+            self.connect()
+        return self._db
+
+    async def warm_up(self, connections: int = None):
+        """Ping the server over several connections at once to fill the pool before traffic arrives"""
+        if connections is None:
+            connections = int(os.environ.get('MONGO_WARM_CONNECTIONS', '4'))
+        self.connect()
+        await asyncio.gather(*[
+            self.client.admin.command("ping") for _ in range(max(connections, 1))
+        ])
+
     async def close(self):
-        self.client.close()
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self._db = None
+
+    async def ensure_indexes(self):
+        """Provision indexes and report any query shape still doing a COLLSCAN"""
+        await ensure_indexes(self.db)
+        await check_query_plans(self.db)
+
+    def invalidate_content(self):
+        """Drop every locally cached content entry"""
+        self.content_cache.clear()
+
+    async def content_changed(self):
+        """Invalidate after a content write and bump the shared version other replicas poll"""
+        self.invalidate_content()
+        try:
+            doc = await self.db.content_versions.find_one_and_update(
+                {"_id": "content"},
+                {"$inc": {"version": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            self.content_version = doc["version"]
+        except Exception as e:
+            logger.warning(f"Could not bump content version: {str(e)}")
+
+    async def get_content_version(self) -> int:
+        doc = await self.db.content_versions.find_one({"_id": "content"})
+        return doc["version"] if doc else 0
+
+    async def acquire_lease(self, name: str, owner: str, seconds: float) -> bool:
+        """Take or renew a named lease shared by all workers and replicas; False if someone else holds it"""
+        now = datetime.utcnow()
+        try:
+            await self.db.leases.find_one_and_update(
+                {"_id": name, "$or": [{"owner": owner}, {"expiresAt": {"$lt": now}}]},
+                {"$set": {"owner": owner, "expiresAt": now + timedelta(seconds=seconds)}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            # The lease document exists and is held by another owner
+            return False
+
+    def cache_stats(self) -> dict:
+        return self.content_cache.stats()
 
     # Contact Submissions
     async def create_contact_submission(self, submission: ContactSubmissionCreate, ip_address: str = None, user_agent: str = None) -> ContactSubmission:
@@ -36,28 +190,175 @@ class DatabaseManager:
         contact_data.id = str(result.inserted_id)
         return contact_data
     
-    async def get_contact_submissions(self) -> List[ContactSubmission]:
-        cursor = self.db.contact_submissions.find().sort("submittedAt", -1)
+    async def insert_contact_documents(self, docs: List[dict]):
+        """Bulk insert prepared submission documents (used by the write-behind queue)"""
+        await self.db.contact_submissions.insert_many(docs, ordered=False)
+    
+    async def get_contact_submissions(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        inquiry_type: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """Newest-first page of submissions plus the cursor for the next page.
+
+        Pagination is keyset based on (submittedAt, _id), so every page is a
+        bounded index range scan no matter how deep the client pages.
+        """
+        query = _contact_filter(status, inquiry_type)
+        if cursor:
+            submitted_at, doc_id = _decode_cursor(cursor)
+            query["$or"] = [
+                {"submittedAt": {"$lt": submitted_at}},
+                {"submittedAt": submitted_at, "_id": {"$lt": doc_id}}
+            ]
+
+        projection = None
+        if fields:
+            # submittedAt and _id are always needed to build the next cursor
+            projection = {field: 1 for field in fields}
+            projection["submittedAt"] = 1
+
+        docs = await self.db.contact_submissions.find(query, projection).sort(
+            [("submittedAt", -1), ("_id", -1)]
+        ).limit(limit + 1).to_list(length=limit + 1)
+
+        next_cursor = _encode_cursor(docs[limit - 1]) if len(docs) > limit else None
         submissions = []
+        for doc in docs[:limit]:
+            doc["id"] = str(doc.pop("_id"))
+            if fields:
+                submissions.append({field: doc[field] for field in ("id", *fields) if field in doc})
+            else:
+                submissions.append(decode_contact(doc))
+        return submissions, next_cursor
+
+    async def iter_contact_submissions(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[dict]:
+        """Yield raw submission documents oldest first, one Motor batch at a time"""
+        query = {}
+        if since or until:
+            query["submittedAt"] = {}
+            if since:
+                query["submittedAt"]["$gte"] = since
+            if until:
+                query["submittedAt"]["$lt"] = until
+
+        cursor = self.db.contact_submissions.find(query).sort(
+            [("submittedAt", 1), ("_id", 1)]
+        ).batch_size(batch_size)
         async for doc in cursor:
-            doc["id"] = str(doc["_id"])
-            submissions.append(ContactSubmission(**doc))
-        return submissions
+            doc["id"] = str(doc.pop("_id"))
+            yield doc
+
+    async def count_contact_submissions(self, status: Optional[str] = None, inquiry_type: Optional[str] = None) -> int:
+        query = _contact_filter(status, inquiry_type)
+        if not query:
+            # Answered from collection metadata instead of a scan
+            return await self.db.contact_submissions.estimated_document_count()
+        # Equality filters are covered by the status/inquiryType indexes (COUNT_SCAN)
+        return await self.db.contact_submissions.count_documents(query)
     
+    async def get_contact_stats(self, days: int = 30, bucket: str = "day") -> dict:
+        """Submission counts for the last ``days`` days, cached for a few seconds"""
+        return await self.stats_cache.get_or_load(
+            ("contact_stats", days, bucket),
+            lambda: self._load_contact_stats(days, bucket)
+        )
+
+    async def _load_contact_stats(self, days: int, bucket: str) -> dict:
+        since = datetime.utcnow() - timedelta(days=days)
+        pipeline = [
+            # Range on by_submitted_at_id; only the grouped fields travel further
+            {"$match": {"submittedAt": {"$gte": since}}},
+            {"$project": {"_id": 0, "inquiryType": 1, "status": 1, "submittedAt": 1}},
+            {"$facet": {
+                "total": [{"$count": "count"}],
+                "byInquiryType": [{"$group": {"_id": "$inquiryType", "count": {"$sum": 1}}}],
+                "byStatus": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+                "timeline": [
+                    {"$group": {
+                        "_id": {"$dateToString": {"format": STATS_BUCKETS[bucket], "date": "$submittedAt"}},
+                        "count": {"$sum": 1}
+                    }},
+                    {"$sort": {"_id": 1}},
+                ],
+            }},
+        ]
+        result = (await self.db.contact_submissions.aggregate(pipeline).to_list(length=1))[0]
+        return {
+            "since": since.isoformat() + "Z",
+            "bucket": bucket,
+            "total": result["total"][0]["count"] if result["total"] else 0,
+            "byInquiryType": {
+                **{inquiry_type.value: 0 for inquiry_type in InquiryType},
+                **{group["_id"]: group["count"] for group in result["byInquiryType"]}
+            },
+            "byStatus": {
+                **{status.value: 0 for status in SubmissionStatus},
+                **{group["_id"]: group["count"] for group in result["byStatus"]}
+            },
+            "timeline": [{"period": group["_id"], "count": group["count"]} for group in result["timeline"]],
+        }
+
     async def update_submission_status(self, submission_id: str, status: str) -> bool:
         result = await self.db.contact_submissions.update_one(
-            {"_id": submission_id},
+            {"_id": _object_id(submission_id)},
             {"$set": {"status": status}}
         )
         return result.modified_count > 0
 
+    async def get_archivable_contacts(self, before: datetime, limit: int) -> List[dict]:
+        """Oldest raw responded submissions from before ``before``"""
+        cursor = self.db.contact_submissions.find(
+            {"status": "responded", "submittedAt": {"$lt": before}}
+        ).sort([("submittedAt", 1), ("_id", 1)]).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    async def archive_contact_documents(self, docs: List[dict]) -> int:
+        """Copy submissions into contact_submissions_archive, then drop them from the hot collection"""
+        try:
+            await self.db.contact_submissions_archive.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            # Copied by an earlier run that was interrupted before its delete
+            errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in errors):
+                raise
+        return await self.delete_contact_documents([doc["_id"] for doc in docs])
+
+    async def delete_contact_documents(self, ids: list) -> int:
+        result = await self.db.contact_submissions.delete_many({"_id": {"$in": ids}})
+        return result.deleted_count
+
+    async def purge_contact_client_info(self, before: datetime) -> int:
+        """Remove ipAddress/userAgent from live and archived submissions older than ``before``"""
+        query = {
+            "submittedAt": {"$lt": before},
+            "$or": [{"ipAddress": {"$ne": None}}, {"userAgent": {"$ne": None}}]
+        }
+        purged = 0
+        for collection in (self.db.contact_submissions, self.db.contact_submissions_archive):
+            result = await collection.update_many(query, {"$unset": {"ipAddress": "", "userAgent": ""}})
+            purged += result.modified_count
+        return purged
+
     # Profile Data
     async def get_profile_data(self) -> Optional[ProfileData]:
-        doc = await self.db.profile_data.find_one()
-        if doc:
-            doc["id"] = str(doc["_id"])
-            return ProfileData(**doc)
-        return None
+        doc = await self.get_profile_document()
+        return ProfileData(**doc) if doc else None
+
+    async def get_profile_document(self) -> Optional[dict]:
+        """Cached, response-ready profile dict (trusted read, no model validation)"""
+        return await self.content_cache.get_or_load("profile", self._load_profile_document)
+
+    async def _load_profile_document(self) -> Optional[dict]:
+        return decode_profile.one(await self.db.profile_data.find_one())
     
     async def update_profile_data(self, profile_data: ProfileData) -> ProfileData:
         profile_dict = profile_data.dict()
@@ -68,83 +369,144 @@ class DatabaseManager:
             profile_dict,
             upsert=True
         )
+        await self.content_changed()
         return profile_data
     
     # Experience
     async def get_experiences(self) -> List[Experience]:
+        return [Experience(**doc) for doc in await self.get_experience_documents()]
+
+    async def get_experience_documents(self) -> List[dict]:
+        """Cached, response-ready active experiences in display order"""
+        return await self.content_cache.get_or_load("experiences", self._load_experience_documents)
+
+    async def _load_experience_documents(self) -> List[dict]:
         cursor = self.db.experiences.find({"isActive": True}).sort("order", 1)
-        experiences = []
-        async for doc in cursor:
-            doc["id"] = str(doc["_id"])
-            experiences.append(Experience(**doc))
-        return experiences
+        return decode_experience.many(await cursor.to_list(length=None))
     
     async def create_experience(self, experience: ExperienceCreate) -> Experience:
         experience_data = Experience(**experience.dict())
         result = await self.db.experiences.insert_one(experience_data.dict())
         experience_data.id = str(result.inserted_id)
+        await self.content_changed()
         return experience_data
     
     async def update_experience(self, experience_id: str, experience: ExperienceCreate) -> Optional[Experience]:
-        result = await self.db.experiences.update_one(
-            {"_id": experience_id},
-            {"$set": experience.dict()}
+        doc = await self.db.experiences.find_one_and_update(
+            {"_id": _object_id(experience_id)},
+            {"$set": experience.dict()},
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count > 0:
-            doc = await self.db.experiences.find_one({"_id": experience_id})
-            if doc:
-                doc["id"] = str(doc["_id"])
-                return Experience(**doc)
-        return None
+        if doc is None:
+            return None
+        await self.content_changed()
+        return Experience(**decode_experience(doc))
     
     async def delete_experience(self, experience_id: str) -> bool:
         result = await self.db.experiences.update_one(
-            {"_id": experience_id},
+            {"_id": _object_id(experience_id)},
             {"$set": {"isActive": False}}
         )
+        if result.modified_count > 0:
+            await self.content_changed()
         return result.modified_count > 0
 
+    async def bulk_update_experiences(self, request: ExperienceBulkRequest) -> dict:
+        return await self._bulk_write_content(self.db.experiences, Experience, request)
+
     # Testimonials
     async def get_testimonials(self) -> List[Testimonial]:
+        return [Testimonial(**doc) for doc in await self.get_testimonial_documents()]
+
+    async def get_testimonial_documents(self) -> List[dict]:
+        """Cached, response-ready active testimonials in display order"""
+        return await self.content_cache.get_or_load("testimonials", self._load_testimonial_documents)
+
+    async def _load_testimonial_documents(self) -> List[dict]:
         cursor = self.db.testimonials.find({"isActive": True}).sort("order", 1)
-        testimonials = []
-        async for doc in cursor:
-            doc["id"] = str(doc["_id"])
-            testimonials.append(Testimonial(**doc))
-        return testimonials
+        return decode_testimonial.many(await cursor.to_list(length=None))
     
     async def create_testimonial(self, testimonial: TestimonialCreate) -> Testimonial:
         testimonial_data = Testimonial(**testimonial.dict())
         result = await self.db.testimonials.insert_one(testimonial_data.dict())
         testimonial_data.id = str(result.inserted_id)
+        await self.content_changed()
         return testimonial_data
     
     async def update_testimonial(self, testimonial_id: str, testimonial: TestimonialCreate) -> Optional[Testimonial]:
-        result = await self.db.testimonials.update_one(
-            {"_id": testimonial_id},
-            {"$set": testimonial.dict()}
+        doc = await self.db.testimonials.find_one_and_update(
+            {"_id": _object_id(testimonial_id)},
+            {"$set": testimonial.dict()},
+            return_document=ReturnDocument.AFTER
         )
-        if result.modified_count > 0:
-            doc = await self.db.testimonials.find_one({"_id": testimonial_id})
-            if doc:
-                doc["id"] = str(doc["_id"])
-                return Testimonial(**doc)
-        return None
+        if doc is None:
+            return None
+        await self.content_changed()
+        return Testimonial(**decode_testimonial(doc))
     
     async def delete_testimonial(self, testimonial_id: str) -> bool:
         result = await self.db.testimonials.update_one(
-            {"_id": testimonial_id},
+            {"_id": _object_id(testimonial_id)},
             {"$set": {"isActive": False}}
         )
+        if result.modified_count > 0:
+            await self.content_changed()
         return result.modified_count > 0
 
+    async def bulk_update_testimonials(self, request: TestimonialBulkRequest) -> dict:
+        return await self._bulk_write_content(self.db.testimonials, Testimonial, request)
+
+    async def _bulk_write_content(self, collection, model, request) -> dict:
+        """Apply upserts, then the new order, then soft deletes in one ordered bulk_write.
+
+        Items without an id get their ObjectId here so their ids can be
+        returned without another read; items with an id that doesn't exist
+        yet are created under that id and reported in ``upsertedIds``.
+        Cached content is invalidated once, also after a partially applied
+        batch.
+        """
+        operations = []
+        inserted_ids = []
+        for item in request.upsert:
+            fields = item.dict(exclude={"id"})
+            if item.id:
+                operations.append(UpdateOne({"_id": _object_id(item.id)}, {"$set": fields}, upsert=True))
+            else:
+                doc = model(**fields).dict()
+                doc["_id"] = ObjectId()
+                inserted_ids.append(str(doc["_id"]))
+                operations.append(InsertOne(doc))
+        for position, item_id in enumerate(request.order):
+            operations.append(UpdateOne({"_id": _object_id(item_id)}, {"$set": {"order": position}}))
+        for item_id in request.delete:
+            operations.append(UpdateOne({"_id": _object_id(item_id)}, {"$set": {"isActive": False}}))
+
+        summary = {"insertedIds": inserted_ids, "upsertedIds": [], "matched": 0, "modified": 0}
+        if not operations:
+            return summary
+        try:
+            result = await collection.bulk_write(operations, ordered=True)
+        except BulkWriteError:
+            await self.content_changed()
+            raise
+        if result.inserted_count or result.upserted_count or result.modified_count:
+            await self.content_changed()
+        summary["upsertedIds"] = [str(upserted_id) for upserted_id in result.upserted_ids.values()]
+        summary["matched"] = result.matched_count
+        summary["modified"] = result.modified_count
+        return summary
+
     # Truffle Expertise
     async def get_truffle_expertise(self) -> Optional[TruffleExpertise]:
-        doc = await self.db.truffle_expertise.find_one()
-        if doc:
-            doc["id"] = str(doc["_id"])
-            return TruffleExpertise(**doc)
-        return None
+        doc = await self.get_truffle_expertise_document()
+        return TruffleExpertise(**doc) if doc else None
+
+    async def get_truffle_expertise_document(self) -> Optional[dict]:
+        """Cached, response-ready truffle expertise dict"""
+        return await self.content_cache.get_or_load("expertise", self._load_truffle_expertise_document)
+
+    async def _load_truffle_expertise_document(self) -> Optional[dict]:
+        return decode_expertise.one(await self.db.truffle_expertise.find_one())
     
     async def update_truffle_expertise(self, expertise: TruffleExpertiseCreate) -> TruffleExpertise:
         expertise_data = TruffleExpertise(**expertise.dict())
@@ -155,6 +517,7 @@ class DatabaseManager:
             expertise_dict,
             upsert=True
         )
+        await self.content_changed()
         return expertise_data
 
 # Global database instance
@@ -0,0 +1,45 @@
+from typing import Iterable, List, Optional, Type
+from pydantic import BaseModel
+
+_REQUIRED = object()
+
+
+class DocumentDecoder:
+    """Fast path from a trusted Mongo document to the dict ``Model(**doc).dict()`` would return.
+
+    Documents written by DatabaseManager already went through the models,
+    so reads only need to pick the model's fields in order, map ``_id`` to
+    ``id`` and fill missing defaults. Enum fields stay plain strings, which
+    serialize to the same JSON. A document missing a required field falls
+    back to full model validation, so it fails with the usual error.
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.fields = []
+        for name, field in model.model_fields.items():
+            if field.is_required():
+                self.fields.append((name, _REQUIRED, None))
+            else:
+                self.fields.append((name, field.default, field.default_factory))
+
+    def __call__(self, doc: dict) -> dict:
+        if "_id" in doc:
+            doc["id"] = str(doc["_id"])
+        decoded = {}
+        for name, default, factory in self.fields:
+            if name in doc:
+                decoded[name] = doc[name]
+            elif factory is not None:
+                decoded[name] = factory()
+            elif default is _REQUIRED:
+                return self.model(**doc).dict()
+            else:
+                decoded[name] = default
+        return decoded
+
+    def one(self, doc: Optional[dict]) -> Optional[dict]:
+        return self(doc) if doc is not None else None
+
+    def many(self, docs: Iterable[dict]) -> List[dict]:
+        return [self(doc) for doc in docs]
@@ -0,0 +1,68 @@
+from datetime import datetime
+from enum import Enum
+from typing import AsyncIterator
+from database import CONTACT_FIELDS
+import csv
+import io
+import json
+
+# Rows buffered into each chunk handed to the StreamingResponse
+ROWS_PER_CHUNK = 200
+
+# Leading characters spreadsheets treat as the start of a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _export_row(doc: dict) -> dict:
+    return {field: _export_value(doc.get(field)) for field in CONTACT_FIELDS}
+
+
+def _csv_cell(value):
+    """Quote user text that Excel/CRM imports would otherwise evaluate as a formula"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def ndjson_chunks(docs: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """One JSON object per line"""
+    lines = []
+    async for doc in docs:
+        lines.append(json.dumps(_export_row(doc), ensure_ascii=False) + "\n")
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+async def csv_chunks(docs: AsyncIterator[dict]) -> AsyncIterator[str]:
+    """RFC 4180 CSV with a header row; cells that look like formulas get a leading quote"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CONTACT_FIELDS)
+    writer.writeheader()
+    rows = 0
+    async for doc in docs:
+        writer.writerow({field: _csv_cell(value) for field, value in _export_row(doc).items()})
+        rows += 1
+        if rows >= ROWS_PER_CHUNK:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_chunks, "application/x-ndjson"),
+    "csv": (csv_chunks, "text/csv"),
+}
@@ -0,0 +1,107 @@
+from pymongo import monitoring
+from typing import Optional
+import asyncio
+import time
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Tracks connection pool usage per server from pymongo's CMAP events"""
+
+    def __init__(self):
+        self.open = 0
+        self.checked_out = 0
+        self.checkout_failures = 0
+        self.pools_cleared = 0
+
+    def stats(self) -> dict:
+        return {
+            "openConnections": self.open,
+            "checkedOut": self.checked_out,
+            "checkoutFailures": self.checkout_failures,
+            "poolsCleared": self.pools_cleared,
+        }
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self.pools_cleared += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self.open += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self.open -= 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self.checkout_failures += 1
+
+    def connection_checked_out(self, event):
+        self.checked_out += 1
+
+    def connection_checked_in(self, event):
+        self.checked_out -= 1
+
+
+pool_monitor = PoolMonitor()
+
+
+class ReadinessProbe:
+    """Database readiness with the last result cached for ``ttl`` seconds.
+
+    Probes arriving while a check is running wait for it instead of
+    issuing their own ping, so load balancer probes add at most one ping
+    per interval.
+    """
+
+    def __init__(self, database_manager, ttl: float = 5.0, timeout: float = 2.0):
+        self.database_manager = database_manager
+        self.ttl = ttl
+        self.timeout = timeout
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def check(self) -> dict:
+        if self._result is not None and time.monotonic() - self._checked_at < self.ttl:
+            return self._result
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._result is None or time.monotonic() - self._checked_at >= self.ttl:
+                self._result = await self._ping()
+                self._checked_at = time.monotonic()
+        return self._result
+
+    async def _ping(self) -> dict:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                self.database_manager.connect().admin.command("ping"),
+                timeout=self.timeout
+            )
+            status, error = "ok", None
+        except Exception as e:
+            # Server selection errors embed the whole topology description
+            status, error = "unavailable", (str(e) or e.__class__.__name__)[:200]
+        result = {
+            "status": status,
+            "pingMs": round((time.perf_counter() - start) * 1000, 2),
+            "pool": pool_monitor.stats(),
+            "checkedAt": time.time(),
+        }
+        if error:
+            result["error"] = error
+        return result
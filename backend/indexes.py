@@ -0,0 +1,143 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Indexes for every query shape DatabaseManager issues. Soft-deleted
+# experiences/testimonials are left out of the partial indexes, so they
+# stop costing anything on the public read path.
+INDEXES = {
+    "experiences": [
+        IndexModel(
+            [("isActive", ASCENDING), ("order", ASCENDING)],
+            name="active_by_order",
+            partialFilterExpression={"isActive": True}
+        ),
+    ],
+    "testimonials": [
+        IndexModel(
+            [("isActive", ASCENDING), ("order", ASCENDING)],
+            name="active_by_order",
+            partialFilterExpression={"isActive": True}
+        ),
+    ],
+    "contact_submissions": [
+        IndexModel([("submittedAt", DESCENDING), ("_id", DESCENDING)], name="by_submitted_at_id"),
+        IndexModel(
+            [("status", ASCENDING), ("submittedAt", DESCENDING), ("_id", DESCENDING)],
+            name="by_status_submitted_at_id"
+        ),
+        IndexModel(
+            [("inquiryType", ASCENDING), ("submittedAt", DESCENDING), ("_id", DESCENDING)],
+            name="by_type_submitted_at_id"
+        ),
+        IndexModel(
+            [("status", ASCENDING), ("inquiryType", ASCENDING), ("submittedAt", DESCENDING), ("_id", DESCENDING)],
+            name="by_status_type_submitted_at_id"
+        ),
+        # sha256 of normalized email+subject+message; older documents have none
+        IndexModel(
+            [("fingerprint", ASCENDING)],
+            name="fingerprint_unique",
+            unique=True,
+            partialFilterExpression={"fingerprint": {"$exists": True}}
+        ),
+    ],
+    "contact_submissions_archive": [
+        IndexModel([("submittedAt", DESCENDING), ("_id", DESCENDING)], name="by_submitted_at_id"),
+    ],
+    # Rate limit buckets expire once they fall out of the sliding window
+    "rate_limits": [
+        IndexModel([("expiresAt", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+}
+
+# Server error code for dropping an index that no longer exists
+INDEX_NOT_FOUND = 27
+
+# Indexes superseded by the definitions above, dropped if still present
+OBSOLETE_INDEXES = {
+    "contact_submissions": ["by_submitted_at"],
+}
+
+# (collection, filter, sort) for each query that must not scan its collection
+QUERY_SHAPES = [
+    ("experiences", {"isActive": True}, [("order", ASCENDING)]),
+    ("testimonials", {"isActive": True}, [("order", ASCENDING)]),
+    ("contact_submissions", {}, [("submittedAt", DESCENDING), ("_id", DESCENDING)]),
+    ("contact_submissions", {"status": "new"}, [("submittedAt", DESCENDING), ("_id", DESCENDING)]),
+    ("contact_submissions", {"inquiryType": "Other"}, [("submittedAt", DESCENDING), ("_id", DESCENDING)]),
+    (
+        "contact_submissions",
+        {"status": "new", "inquiryType": "Other"},
+        [("submittedAt", DESCENDING), ("_id", DESCENDING)]
+    ),
+    # Archival takes the oldest responded submissions first
+    (
+        "contact_submissions",
+        {"status": "responded", "submittedAt": {"$lt": datetime(2000, 1, 1)}},
+        [("submittedAt", ASCENDING), ("_id", ASCENDING)]
+    ),
+    # Export walks the same index in the other direction
+    (
+        "contact_submissions",
+        {"submittedAt": {"$gte": datetime(2000, 1, 1)}},
+        [("submittedAt", ASCENDING), ("_id", ASCENDING)]
+    ),
+]
+
+
+async def ensure_indexes(db) -> None:
+    """Create all indexes; safe to call on every startup"""
+    for collection, indexes in INDEXES.items():
+        try:
+            names = await db[collection].create_indexes(indexes)
+            logger.info(f"Indexes ready on {collection}: {', '.join(names)}")
+        except OperationFailure as e:
+            # Usually an existing index with the same name but different options
+            logger.error(f"Could not create indexes on {collection}: {str(e)}")
+
+    for collection, names in OBSOLETE_INDEXES.items():
+        existing = await db[collection].index_information()
+        for name in names:
+            if name not in existing:
+                continue
+            try:
+                await db[collection].drop_index(name)
+                logger.info(f"Dropped obsolete index {name} on {collection}")
+            except OperationFailure as e:
+                # Another worker starting at the same time dropped it first
+                if e.code != INDEX_NOT_FOUND:
+                    logger.error(f"Could not drop obsolete index {name} on {collection}: {str(e)}")
+
+
+def _plan_stages(plan: dict):
+    """Yield every stage name in an explain() plan tree"""
+    if not plan:
+        return
+    yield plan.get("stage")
+    if "inputStage" in plan:
+        yield from _plan_stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        yield from _plan_stages(child)
+
+
+async def check_query_plans(db) -> list:
+    """Explain each known query shape and log the ones that still do a COLLSCAN"""
+    collscans = []
+    for collection, query, sort in QUERY_SHAPES:
+        try:
+            explain = await db[collection].find(query).sort(sort).explain()
+        except Exception as e:
+            logger.warning(f"Could not explain query on {collection}: {str(e)}")
+            continue
+
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        # The slot-based engine nests the classic plan under "queryPlan"
+        winning_plan = winning_plan.get("queryPlan", winning_plan)
+        if "COLLSCAN" in _plan_stages(winning_plan):
+            collscans.append(collection)
+            logger.warning(f"Query on {collection} {query} sorted by {sort} uses a COLLSCAN")
+    return collscans
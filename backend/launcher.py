@@ -0,0 +1,99 @@
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    """CPUs this process may use, honouring affinity masks and cgroup v2 CPU quotas"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def default_workers() -> int:
+    """WEB_CONCURRENCY if set, else one worker per available CPU"""
+    if os.environ.get("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    return available_cpus()
+
+
+def _pick(requested: str, module: str) -> str:
+    """Use the optional accelerated implementation when installed"""
+    if requested != "auto":
+        return requested
+    return module if find_spec(module) else ("asyncio" if module == "uvloop" else "h11")
+
+
+def serve(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+    loop: Optional[str] = None,
+    http: Optional[str] = None,
+    keep_alive: Optional[float] = None,
+    backlog: Optional[int] = None,
+    graceful_timeout: Optional[float] = None,
+    access_log: Optional[bool] = None
+):
+    """Run server:app under uvicorn with production settings.
+
+    Every argument falls back to an environment variable, then a default.
+    With more than one worker, uvicorn supervises the worker processes
+    and replaces any that die. Each worker runs the app's startup and
+    shutdown hooks, so contact queues are drained and MongoDB clients
+    closed in every worker on SIGTERM. Rate limits default to the shared
+    MongoDB backend then, as in-memory counters would allow the limit
+    once per worker.
+    """
+    import uvicorn
+
+    host = host or os.environ.get("HOST", "0.0.0.0")
+    port = port or int(os.environ.get("PORT", "8001"))
+    workers = workers or default_workers()
+    loop = _pick(loop or os.environ.get("UVICORN_LOOP", "auto"), "uvloop")
+    http = _pick(http or os.environ.get("UVICORN_HTTP", "auto"), "httptools")
+    if keep_alive is None:
+        keep_alive = float(os.environ.get("KEEP_ALIVE_SECONDS", "65"))
+    if backlog is None:
+        backlog = int(os.environ.get("BACKLOG", "2048"))
+    if graceful_timeout is None:
+        graceful_timeout = float(os.environ.get("GRACEFUL_SHUTDOWN_SECONDS", "20"))
+    if access_log is None:
+        access_log = os.environ.get("ACCESS_LOG", "false").lower() == "true"
+
+    if workers > 1:
+        # Read by every worker's rate_limit module; an explicit setting wins
+        os.environ.setdefault("RATE_LIMIT_BACKEND", "mongo")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logger.info(
+        f"Serving on {host}:{port} with {workers} worker(s), loop={loop}, http={http}, "
+        f"keep-alive={keep_alive}s, backlog={backlog}, rate-limit backend={os.environ.get('RATE_LIMIT_BACKEND', 'memory')}"
+    )
+    uvicorn.run(
+        "server:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=keep_alive,
+        backlog=backlog,
+        timeout_graceful_shutdown=graceful_timeout,
+        access_log=access_log,
+        proxy_headers=True,
+        forwarded_allow_ips=os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+        app_dir=str(Path(__file__).parent)
+    )
@@ -0,0 +1,236 @@
+from typing import Dict, Iterable, List, Tuple
+import functools
+import inspect
+import math
+import time
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        registry.append(self)
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in sorted(self._values.items()):
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            # [per-bucket counts..., sum]
+            state = self._values[key] = [0] * len(self.buckets) + [0.0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+                break
+        state[-1] += value
+
+    def _render_sample(self, key, state) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, state):
+            cumulative += count
+            labels = _format_labels(self.labelnames, key, f'le="{_format_number(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_number(state[-1])}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+registry: List[_Metric] = []
+
+
+def render_metrics() -> str:
+    """All registered metrics in the Prometheus text exposition format (0.0.4)"""
+    lines = []
+    for metric in registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# HTTP
+http_requests_total = Counter(
+    "http_requests_total", "HTTP requests by route, method and status", ("method", "route", "status")
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route")
+)
+http_requests_in_progress = Gauge("http_requests_in_progress", "HTTP requests currently being served")
+
+# Database
+db_operation_duration_seconds = Histogram(
+    "db_operation_duration_seconds", "DatabaseManager call latency", ("operation",), buckets=DB_BUCKETS
+)
+db_operation_errors_total = Counter("db_operation_errors_total", "DatabaseManager calls that raised", ("operation",))
+db_operations_in_progress = Gauge("db_operations_in_progress", "DatabaseManager calls currently running", ("operation",))
+
+# Content
+content_fallbacks_total = Counter(
+    "content_fallbacks_total", "Content responses served from the built-in defaults", ("section",)
+)
+content_cache_hits = Gauge("content_cache_hits", "Content cache hits since startup")
+content_cache_misses = Gauge("content_cache_misses", "Content cache misses since startup")
+content_cache_entries = Gauge("content_cache_entries", "Entries currently held by the content cache")
+
+# Contact form
+contact_rejections_total = Counter(
+    "contact_rejections_total", "Contact submissions rejected before storage", ("reason",)
+)
+
+
+def _timed(operation: str, func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        db_operations_in_progress.inc(operation=operation)
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            db_operation_errors_total.inc(operation=operation)
+            raise
+        finally:
+            db_operation_duration_seconds.observe(time.perf_counter() - start, operation=operation)
+            db_operations_in_progress.dec(operation=operation)
+    return wrapper
+
+
+def _timed_generator(operation: str, func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        db_operations_in_progress.inc(operation=operation)
+        start = time.perf_counter()
+        try:
+            async for item in func(*args, **kwargs):
+                yield item
+        except Exception:
+            db_operation_errors_total.inc(operation=operation)
+            raise
+        finally:
+            db_operation_duration_seconds.observe(time.perf_counter() - start, operation=operation)
+            db_operations_in_progress.dec(operation=operation)
+    return wrapper
+
+
+def instrument_db(cls):
+    """Class decorator timing every async method (and async generator) of a database manager"""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("__"):
+            continue
+        if inspect.iscoroutinefunction(attr):
+            setattr(cls, name, _timed(name.lstrip("_"), attr))
+        elif inspect.isasyncgenfunction(attr):
+            setattr(cls, name, _timed_generator(name.lstrip("_"), attr))
+    return cls
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording request counts, latency and in-flight requests.
+
+    Requests are labelled with the matched route template (``/api/contact/{submission_id}/status``)
+    rather than the raw path, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths = None
+
+    def _route_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if self._route_paths is None:
+            self._route_paths = {
+                route.endpoint: route.path
+                for route in scope["app"].routes
+                if hasattr(route, "endpoint")
+            }
+        return self._route_paths.get(endpoint, "unmatched")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+        http_requests_in_progress.inc()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_progress.dec()
+            route = self._route_label(scope)
+            method = scope["method"]
+            http_request_duration_seconds.observe(time.perf_counter() - start, method=method, route=route)
+            http_requests_total.inc(method=method, route=route, status=status)
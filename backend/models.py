@@ -73,6 +73,14 @@ class Experience(BaseModel):
     order: int
     isActive: bool
 
+class ExperienceUpsert(ExperienceCreate):
+    id: Optional[str] = None
+
+class ExperienceBulkRequest(BaseModel):
+    upsert: List[ExperienceUpsert] = []  # items without an id, or with an unknown id, are inserted
+    order: List[str] = []  # ids in display order; order is set to the list position
+    delete: List[str] = []
+
 # Testimonial Models
 class TestimonialCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
@@ -91,6 +99,14 @@ class Testimonial(BaseModel):
     order: int
     isActive: bool
 
+class TestimonialUpsert(TestimonialCreate):
+    id: Optional[str] = None
+
+class TestimonialBulkRequest(BaseModel):
+    upsert: List[TestimonialUpsert] = []
+    order: List[str] = []
+    delete: List[str] = []
+
 # Truffle Expertise Models
 class ExpertiseMetric(BaseModel):
     label: str
@@ -118,6 +134,11 @@ class SuccessResponse(BaseModel):
     data: Optional[Union[dict, list]] = None
     message: str
 
+class ContactSubmissionPage(BaseModel):
+    items: List[dict]
+    nextCursor: Optional[str] = None
+    total: Optional[int] = None
+
 class ErrorResponse(BaseModel):
     success: bool = False
     error: dict
\ No newline at end of file
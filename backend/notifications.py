@@ -0,0 +1,260 @@
+from pathlib import Path
+from typing import List, Optional
+from fastapi.encoders import jsonable_encoder
+import asyncio
+import json
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# What the site owner needs to answer a submission; client info and internal fields stay in MongoDB
+NOTIFY_FIELDS = ("name", "email", "subject", "message", "inquiryType", "submittedAt")
+
+# Line breaks, tabs and other control characters; user text must not break header lines
+_CONTROL_RUN = re.compile(r"[\s\x00-\x1f\x7f]+")
+
+
+class PermanentNotificationError(Exception):
+    """A send that can never succeed, e.g. a malformed message or a 4xx from the webhook; not retried"""
+
+
+def single_line(text, limit: int = 200) -> str:
+    """Collapse whitespace and control characters so user text is safe in a header or digest line"""
+    text = _CONTROL_RUN.sub(" ", str(text)).strip()
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+class SmtpTransport:
+    def __init__(self, host: str, port: int, sender: str, recipients: List[str],
+                 username: str = None, password: str = None, starttls: bool = True, timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = recipients
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def send(self, subject: str, body: str, submissions: List[dict]):
+        # Imported on first use; most deployments never load the SMTP stack
+        from email.message import EmailMessage
+        import smtplib
+
+        try:
+            message = EmailMessage()
+            message["Subject"] = subject
+            message["From"] = self.sender
+            message["To"] = ", ".join(self.recipients)
+            if len(submissions) == 1:
+                message["Reply-To"] = submissions[0]["email"]
+            message.set_content(body)
+        except (ValueError, TypeError) as e:
+            raise PermanentNotificationError(f"Could not build notification email: {str(e)}") from e
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            try:
+                smtp.send_message(message)
+            except smtplib.SMTPResponseException as e:
+                # 5xx replies (unknown recipient, rejected sender...) won't change on retry
+                if e.smtp_code >= 500:
+                    raise PermanentNotificationError(f"SMTP server rejected the notification: {e.smtp_code}") from e
+                raise
+            except smtplib.SMTPRecipientsRefused as e:
+                raise PermanentNotificationError("SMTP server refused every recipient") from e
+
+
+class WebhookTransport:
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, subject: str, body: str, submissions: List[dict]):
+        import requests
+
+        response = requests.post(
+            self.url,
+            json={"subject": subject, "text": body, "submissions": submissions},
+            timeout=self.timeout
+        )
+        if 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+            raise PermanentNotificationError(f"Webhook rejected the notification: HTTP {response.status_code}")
+        response.raise_for_status()
+
+
+class FileTransport:
+    """Appends each notification as a JSON line; for local development and tests"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def send(self, subject: str, body: str, submissions: List[dict]):
+        record = {"subject": subject, "text": body, "submissions": submissions}
+        with open(self.path, "a", encoding="utf-8") as sink:
+            sink.write(json.dumps(record) + "\n")
+
+
+def format_notification(submissions: List[dict]):
+    """Subject and plain-text body: the message itself, or a digest for a burst"""
+    if len(submissions) == 1:
+        submission = submissions[0]
+        subject = f"[Portfolio] {single_line(submission['inquiryType'])}: {single_line(submission['subject'])}"
+        body = (
+            f"From: {single_line(submission['name'])} <{submission['email']}>\n"
+            f"Inquiry type: {submission['inquiryType']}\n\n"
+            f"{submission['message']}\n"
+        )
+        return subject, body
+
+    subject = f"[Portfolio] {len(submissions)} new contact submissions"
+    entries = [
+        f"- {single_line(submission['name'])} <{single_line(submission['email'])}> "
+        f"({single_line(submission['inquiryType'])}): {single_line(submission['subject'])}"
+        for submission in submissions
+    ]
+    return subject, "\n".join(entries) + "\n"
+
+
+class ContactNotifier:
+    """Background worker that tells the site owner about new contact submissions.
+
+    ``notify`` only enqueues, so the HTTP path never waits on SMTP or a
+    webhook. Submissions arriving within ``digest_window`` seconds of each
+    other go out as one digest of up to ``max_batch`` entries. Failed sends
+    are retried with exponential backoff, then dropped with an error log;
+    the submissions themselves are already stored. A
+    ``PermanentNotificationError`` is dropped at once instead of holding up
+    later notifications.
+    """
+
+    def __init__(self, transport, digest_window: float = 30.0, max_batch: int = 50,
+                 max_attempts: int = 5, maxsize: int = 1000):
+        self.transport = transport
+        self.digest_window = digest_window
+        self.max_batch = max_batch
+        self.max_attempts = max_attempts
+        self.maxsize = maxsize
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        # Created in start() so it binds to the serving event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if self.transport is None or self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._task = asyncio.create_task(self._run())
+
+    def notify(self, submissions: List[dict]):
+        """Queue stored submissions for notification; never blocks"""
+        if not self.running:
+            return
+        for submission in submissions:
+            # Plain JSON types, so enums and datetimes format the same in every transport
+            entry = jsonable_encoder({field: submission.get(field) for field in NOTIFY_FIELDS})
+            if "_id" in submission:
+                entry = {"id": str(submission["_id"]), **entry}
+            try:
+                self._queue.put_nowait(entry)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                logger.warning("Notification queue is full, dropping a contact notification")
+
+    async def stop(self):
+        """Stop the worker; whatever is still pending gets one final send attempt"""
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped
+        }
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.digest_window
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._send(batch, self.max_attempts)
+                batch = []
+        except asyncio.CancelledError:
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if batch:
+                await self._send(batch, attempts=1)
+            raise
+
+    async def _send(self, batch: List[dict], attempts: int):
+        subject, body = format_notification(batch)
+        for attempt in range(1, attempts + 1):
+            try:
+                await asyncio.to_thread(self.transport.send, subject, body, batch)
+                self.sent += len(batch)
+                return
+            except PermanentNotificationError as e:
+                logger.error(f"Contact notification cannot be sent: {str(e)}")
+                break
+            except Exception as e:
+                logger.warning(f"Contact notification failed (attempt {attempt}/{attempts}): {str(e)}")
+                if attempt < attempts:
+                    await asyncio.sleep(min(2 ** attempt, 300))
+        self.failed += len(batch)
+        logger.error(f"Gave up notifying about {len(batch)} contact submissions")
+
+
+def _transport_from_env():
+    kind = os.environ.get("NOTIFY_TRANSPORT", "off").lower()
+    if kind == "smtp":
+        return SmtpTransport(
+            host=os.environ["SMTP_HOST"],
+            port=int(os.environ.get("SMTP_PORT", "587")),
+            sender=os.environ["SMTP_FROM"],
+            recipients=[address.strip() for address in os.environ["NOTIFY_EMAIL_TO"].split(",")],
+            username=os.environ.get("SMTP_USERNAME"),
+            password=os.environ.get("SMTP_PASSWORD"),
+            starttls=os.environ.get("SMTP_STARTTLS", "true").lower() == "true"
+        )
+    if kind == "webhook":
+        return WebhookTransport(os.environ["NOTIFY_WEBHOOK_URL"])
+    if kind == "file":
+        return FileTransport(Path(os.environ.get("NOTIFY_FILE_PATH", Path(__file__).parent / "notifications.jsonl")))
+    return None
+
+
+contact_notifier = ContactNotifier(
+    _transport_from_env(),
+    digest_window=float(os.environ.get("NOTIFY_DIGEST_SECONDS", "30")),
+    max_batch=int(os.environ.get("NOTIFY_MAX_BATCH", "50")),
+    max_attempts=int(os.environ.get("NOTIFY_MAX_ATTEMPTS", "5"))
+)
@@ -0,0 +1,187 @@
+from collections import OrderedDict
+from datetime import datetime
+from fastapi import HTTPException, Request
+from pymongo import ReturnDocument
+from typing import Dict, Optional, Tuple
+import asyncio
+import logging
+import math
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _retry_after(limit: int, window: float, current: int, previous: int, elapsed: float) -> float:
+    """Seconds until the two-window estimate drops below ``limit`` again"""
+    if current < limit:
+        # Wait for enough of the previous window to slide out
+        needed = 1 - (limit - current) / previous
+        return (needed - elapsed) * window
+    # The current window alone is full: it becomes "previous" at the next boundary
+    needed = 1 - limit / current if current else 0
+    return (1 - elapsed + max(needed, 0)) * window
+
+
+class SlidingWindowLimiter:
+    """Sliding-window rate limiter with O(1) time and memory per key.
+
+    Each key keeps only the hit counts of the current and previous fixed
+    windows. The number of hits in the sliding window is estimated by
+    weighting the previous window by how much of it still overlaps.
+    Keys live in an LRU map bounded by ``max_keys``. Keys idle for two
+    full windows no longer affect any decision and are evicted as they
+    reach the old end of the map.
+    """
+
+    def __init__(self, limit: int, window: float, max_keys: int = 10000):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        # key -> [window index, hits in that window, hits in the window before]
+        self._keys: "OrderedDict[str, list]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def hit(self, key: str, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Record a hit for ``key``; return (allowed, seconds until the next hit would be allowed)"""
+        now = time.time() if now is None else now
+        index = int(now // self.window)
+        elapsed = (now % self.window) / self.window
+
+        state = self._keys.get(key)
+        if state is None or state[0] < index - 1:
+            state = [index, 0, 0]
+        elif state[0] == index - 1:
+            state = [index, 0, state[1]]
+        self._keys[key] = state
+        self._keys.move_to_end(key)
+        self._evict(index)
+
+        _, current, previous = state
+        if previous * (1 - elapsed) + current >= self.limit:
+            return False, _retry_after(self.limit, self.window, current, previous, elapsed)
+
+        state[1] += 1
+        return True, 0.0
+
+    def _evict(self, index: int) -> None:
+        while self._keys:
+            oldest_key, oldest = next(iter(self._keys.items()))
+            if len(self._keys) > self.max_keys or oldest[0] < index - 1:
+                del self._keys[oldest_key]
+            else:
+                break
+
+
+class MemoryRateLimitBackend:
+    """Per-process counters; limits multiply with workers and reset on restart"""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._limiters: Dict[str, SlidingWindowLimiter] = {}
+
+    async def hit(self, scope: str, key: str, limit: int, window: int) -> Tuple[bool, float]:
+        limiter = self._limiters.get(scope)
+        if limiter is None:
+            limiter = self._limiters[scope] = SlidingWindowLimiter(limit, window, self.max_keys)
+        return limiter.hit(key)
+
+
+class MongoRateLimitBackend:
+    """Counters shared by every worker and replica through the app database.
+
+    Uses the same two-window estimate as SlidingWindowLimiter. Each
+    (scope, key, window) bucket is one document in ``rate_limits``,
+    incremented atomically with ``$inc``. A TTL index on ``expiresAt``
+    removes buckets once they can no longer affect a decision.
+    """
+
+    def __init__(self, database_manager, collection: str = "rate_limits"):
+        self.database_manager = database_manager
+        self.collection = collection
+
+    async def hit(self, scope: str, key: str, limit: int, window: int) -> Tuple[bool, float]:
+        now = time.time()
+        index = int(now // window)
+        elapsed = (now % window) / window
+        buckets = self.database_manager.db[self.collection]
+        current_id = f"{scope}:{key}:{index}"
+
+        current_doc, previous_doc = await asyncio.gather(
+            buckets.find_one_and_update(
+                {"_id": current_id},
+                {
+                    "$inc": {"count": 1},
+                    "$setOnInsert": {"expiresAt": datetime.utcfromtimestamp((index + 2) * window)}
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            ),
+            buckets.find_one({"_id": f"{scope}:{key}:{index - 1}"}, {"count": 1})
+        )
+        current = current_doc["count"] - 1
+        previous = previous_doc["count"] if previous_doc else 0
+        if previous * (1 - elapsed) + current < limit:
+            return True, 0.0
+
+        # Rejected hits must not keep the window saturated
+        await buckets.update_one({"_id": current_id}, {"$inc": {"count": -1}})
+        return False, _retry_after(limit, window, current, previous, elapsed)
+
+
+def _backend_from_env():
+    max_keys = int(os.environ.get("RATE_LIMIT_MAX_KEYS", "10000"))
+    backend = os.environ.get("RATE_LIMIT_BACKEND", "memory").lower()
+    if backend == "mongo":
+        from database import db_manager
+        return MongoRateLimitBackend(db_manager)
+    if backend != "memory":
+        logger.warning(f"Unknown RATE_LIMIT_BACKEND {backend!r}, using in-memory rate limiting")
+    return MemoryRateLimitBackend(max_keys)
+
+
+def _configured_limit(scope: str, limit: int, window: int) -> Tuple[int, int]:
+    """Read a RATE_LIMIT_<SCOPE>="<requests>/<seconds>" override from the environment"""
+    value = os.environ.get(f"RATE_LIMIT_{scope.upper()}")
+    if not value:
+        return limit, window
+    requests, _, seconds = value.partition("/")
+    return int(requests), int(seconds or window)
+
+
+class RateLimit:
+    """FastAPI dependency enforcing a per-client-IP limit for one route scope.
+
+    Usage: ``@router.post(..., dependencies=[Depends(RateLimit("contact", 3, 3600))])``
+    Counters live in the backend selected by RATE_LIMIT_BACKEND (memory or mongo).
+    """
+
+    def __init__(self, scope: str, limit: int, window: int, backend=None):
+        self.scope = scope
+        self.limit, self.window = _configured_limit(scope, limit, window)
+        self.backend = backend or default_backend
+        rate_limiters[scope] = self
+
+    async def __call__(self, request: Request):
+        client_ip = request.client.host if request.client else "unknown"
+        try:
+            allowed, retry_after = await self.backend.hit(self.scope, client_ip, self.limit, self.window)
+        except Exception as e:
+            # Fail open: a rate limiter outage must not take the route down with it
+            logger.error(f"Rate limit check failed for {self.scope}: {str(e)}")
+            return
+        if not allowed:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests. Please try again later.",
+                # Right at a window boundary the estimate can be 0; never tell clients to retry at once
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+            )
+
+
+default_backend = _backend_from_env()
+
+# Scope -> RateLimit, for inspection
+rate_limiters: Dict[str, RateLimit] = {}
@@ -0,0 +1,152 @@
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from typing import Dict, Optional, Tuple
+from compression import HAS_BROTLI, brotli_bytes, gzip_bytes
+from models import SuccessResponse
+import hashlib
+import json
+
+CONTENT_CACHE_CONTROL = "public, no-cache"
+
+# Preferred first when the client weights encodings equally
+SUPPORTED_ENCODINGS = ("br", "gzip") if HAS_BROTLI else ("gzip",)
+_ENCODERS = {"br": brotli_bytes, "gzip": gzip_bytes}
+# Each encoding is a different representation, so it gets its own strong ETag
+_ETAG_SUFFIXES = {"br": "-br", "gzip": "-gz"}
+
+
+class RenderedContent:
+    """A response body serialized once, plus its strong ETag.
+
+    Compressed variants are built on first request and kept for the life of
+    the object, which lives in the content cache, so each content version
+    is compressed at most once per encoding.
+    """
+
+    __slots__ = ("body", "etag", "fallbacks", "_encoded")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        # Content sections served from the built-in defaults
+        self.fallbacks: Tuple[str, ...] = ()
+        self._encoded = {}
+
+    def encoded(self, encoding: Optional[str]) -> Tuple[bytes, str]:
+        """Body and ETag for ``encoding`` (None for identity)"""
+        if encoding is None:
+            return self.body, self.etag
+        variant = self._encoded.get(encoding)
+        if variant is None:
+            variant = self._encoded[encoding] = (
+                _ENCODERS[encoding](self.body),
+                self.etag[:-1] + _ETAG_SUFFIXES[encoding] + '"'
+            )
+        return variant
+
+    def etags(self):
+        return [self.etag] + [etag for _, etag in self._encoded.values()]
+
+
+def render_success(data, message: str) -> RenderedContent:
+    """Validate and encode a SuccessResponse exactly the way JSONResponse would"""
+    payload = jsonable_encoder(SuccessResponse(data=data, message=message))
+    body = json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return RenderedContent(body)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _encoding_weights(accept_encoding: str) -> Dict[str, float]:
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip()] = quality
+    return weights
+
+
+def encoding_quality(accept_encoding: str, encoding: str) -> float:
+    """The q-value an Accept-Encoding header gives ``encoding``; 0 means refused"""
+    if not accept_encoding:
+        return 0.0
+    weights = _encoding_weights(accept_encoding)
+    return weights.get(encoding, weights.get("*", 0.0))
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported encoding from an Accept-Encoding header, or None for identity"""
+    if not accept_encoding:
+        return None
+    weights = _encoding_weights(accept_encoding)
+    best, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def content_response(request: Request, rendered: RenderedContent) -> Response:
+    """Serve pre-rendered content, compressed when the client allows it.
+
+    Answers 304 when the client already holds any representation of this
+    content version.
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    body, etag = rendered.encoded(encoding)
+    headers = {"ETag": etag, "Cache-Control": CONTENT_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and any(etag_matches(if_none_match, known) for known in rendered.etags()):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class NegotiatingGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that honours q-values the way content routes do.
+
+    Starlette gzips whenever "gzip" appears in Accept-Encoding, including
+    ``gzip;q=0``. That would compress identity content responses under
+    their identity ETag. Here gzip is applied only when the client accepts
+    it with q > 0.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            accept_encoding = Headers(scope=scope).get("accept-encoding")
+            if encoding_quality(accept_encoding, "gzip") > 0:
+                responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
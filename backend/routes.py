@@ -1,36 +1,30 @@
-from fastapi import APIRouter, HTTPException, Request, Depends
-from fastapi.responses import JSONResponse
-from typing import List
+from fastapi import APIRouter, HTTPException, Request, Depends, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Optional
 from models import (
     ContactSubmissionCreate, ContactSubmission, SuccessResponse, ErrorResponse,
     ProfileData, PersonalInfo, Experience, ExperienceCreate,
     Testimonial, TestimonialCreate, TruffleExpertise, TruffleExpertiseCreate,
-    SubmissionStatus
+    SubmissionStatus, InquiryType, ContactSubmissionPage,
+    ExperienceBulkRequest, TestimonialBulkRequest
 )
-from database import db_manager
+from database import db_manager, CONTACT_FIELDS
+from content import get_rendered_section
+from responses import content_response
+from export import EXPORT_FORMATS
+from contact_queue import contact_queue, QueueFullError
+from content_watcher import content_watcher
+from rate_limit import RateLimit
+from admin_auth import require_admin
+from spam_filter import spam_filter, DuplicateSubmissionError, SpamSubmissionError
 import logging
 from datetime import datetime, timedelta
 import asyncio
-from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
-# Rate limiting storage (in production, use Redis)
-rate_limit_storage = defaultdict(list)
-
-def check_rate_limit(ip_address: str, max_requests: int = 3, time_window: int = 3600):
-    """Check if IP address has exceeded rate limit"""
-    now = datetime.utcnow()
-    requests = rate_limit_storage[ip_address]
-    
-    # Remove old requests outside time window
-    requests[:] = [req_time for req_time in requests if (now - req_time).total_seconds() < time_window]
-    
-    if len(requests) >= max_requests:
-        return False
-    
-    requests.append(now)
-    return True
+# Contact form: 3 submissions per client IP per hour (override with RATE_LIMIT_CONTACT)
+contact_rate_limit = RateLimit("contact", limit=3, window=3600)
 
 router = APIRouter(prefix="/api")
 
@@ -39,8 +33,14 @@ router = APIRouter(prefix="/api")
 async def api_health_check():
     return {"status": "healthy", "service": "portfolio-api"}
 
+# Content cache statistics
+@router.get("/cache/stats")
+async def get_cache_stats():
+    stats = {**db_manager.cache_stats(), "watcher": content_watcher.stats()}
+    return SuccessResponse(data=stats, message="Cache statistics retrieved successfully")
+
 # Contact Form Routes
-@router.post("/contact", response_model=SuccessResponse)
+@router.post("/contact", response_model=SuccessResponse, dependencies=[Depends(contact_rate_limit)])
 async def submit_contact_form(
     submission: ContactSubmissionCreate,
     request: Request
@@ -50,43 +50,108 @@ async def submit_contact_form(
         client_ip = request.client.host
         user_agent = request.headers.get("user-agent", "")
         
-        # Rate limiting
-        if not check_rate_limit(client_ip):
-            raise HTTPException(
-                status_code=429,
-                detail="Too many requests. Please try again later."
-            )
-        
-        # Create submission
-        contact = await db_manager.create_contact_submission(
-            submission, 
-            ip_address=client_ip,
-            user_agent=user_agent
+        # Turn away resubmitted payloads and obvious spam before they reach Mongo
+        fingerprint = spam_filter.check(submission)
+
+        # Queue the submission; the id is assigned before it reaches Mongo
+        contact = ContactSubmission(
+            **submission.dict(),
+            ipAddress=client_ip,
+            userAgent=user_agent
         )
+        contact_id = await contact_queue.submit(contact, fingerprint=fingerprint)
+        spam_filter.remember(fingerprint)
         
         logger.info(f"New contact submission from {submission.email}")
         
         return SuccessResponse(
-            data={"id": contact.id},
+            data={"id": contact_id},
             message="Thank you for your message! I'll get back to you within 24 hours."
         )
         
     except HTTPException:
         raise
+    except DuplicateSubmissionError:
+        raise HTTPException(status_code=409, detail="We already received this message. Thank you!")
+    except SpamSubmissionError as e:
+        logger.warning(f"Rejected contact submission from {client_ip}: {str(e)}")
+        raise HTTPException(status_code=400, detail="Your message could not be accepted.")
+    except QueueFullError:
+        logger.warning("Contact submission queue is full, rejecting submission")
+        raise HTTPException(
+            status_code=503,
+            detail="We're receiving a lot of messages right now. Please try again shortly.",
+            headers={"Retry-After": "5"}
+        )
     except Exception as e:
         logger.error(f"Error creating contact submission: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
-@router.get("/contact", response_model=List[ContactSubmission])
-async def get_contact_submissions():
-    """Get all contact submissions (admin only in production)"""
+@router.get("/contact", response_model=ContactSubmissionPage)
+async def get_contact_submissions(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    status: Optional[SubmissionStatus] = None,
+    inquiry_type: Optional[InquiryType] = Query(None, alias="inquiryType"),
+    fields: Optional[str] = Query(None, description="Comma-separated list of fields to return"),
+    include_total: bool = Query(True, alias="includeTotal")
+):
+    """Page through contact submissions, newest first (admin only in production)"""
+    selected = None
+    if fields:
+        selected = [field.strip() for field in fields.split(",") if field.strip() and field.strip() != "id"]
+        unknown = [field for field in selected if field not in CONTACT_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    status_value = status.value if status else None
+    inquiry_value = inquiry_type.value if inquiry_type else None
     try:
-        submissions = await db_manager.get_contact_submissions()
-        return submissions
+        submissions, next_cursor = await db_manager.get_contact_submissions(
+            limit=limit,
+            cursor=cursor,
+            status=status_value,
+            inquiry_type=inquiry_value,
+            fields=selected
+        )
+        total = None
+        if include_total:
+            total = await db_manager.count_contact_submissions(status_value, inquiry_value)
+        return ContactSubmissionPage(items=submissions, nextCursor=next_cursor, total=total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching contact submissions: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.get("/contact/stats", response_model=SuccessResponse)
+async def get_contact_stats(
+    days: int = Query(30, ge=1, le=366),
+    bucket: str = Query("day", pattern="^(day|week)$")
+):
+    """Submission counts by inquiry type, status and day/week (admin only in production)"""
+    try:
+        stats = await db_manager.get_contact_stats(days=days, bucket=bucket)
+        return SuccessResponse(data=stats, message="Contact statistics retrieved successfully")
+    except Exception as e:
+        logger.error(f"Error computing contact statistics: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.get("/contact/export", dependencies=[Depends(require_admin)])
+async def export_contact_submissions(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+):
+    """Stream every submission in a date range as NDJSON or CSV (requires X-Admin-Token)"""
+    chunks, media_type = EXPORT_FORMATS[format]
+    docs = db_manager.iter_contact_submissions(since=since, until=until)
+    return StreamingResponse(
+        chunks(docs),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="contact_submissions.{format}"'}
+    )
+
 @router.patch("/contact/{submission_id}/status")
 async def update_submission_status(
     submission_id: str,
@@ -104,172 +169,73 @@ async def update_submission_status(
         logger.error(f"Error updating submission status: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Aggregated Portfolio Route
+@router.get("/portfolio")
+async def get_portfolio(request: Request):
+    """Profile, experience, testimonials and expertise in one response"""
+    try:
+        rendered = await get_rendered_section("portfolio")
+        return content_response(request, rendered)
+    except Exception as e:
+        logger.error(f"Error fetching portfolio data: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 # Profile Data Routes
 @router.get("/profile")
-async def get_profile():
+async def get_profile(request: Request):
     try:
-        profile = await db_manager.get_profile_data()
-        if not profile:
-            # Return default data if none exists
-            default_profile = {
-                "personal": {
-                    "name": "Robert Chang",
-                    "title": "Managing Director & Chief Truffle Officer",
-                    "company": "American Truffle Company",
-                    "location": "San Francisco, California, United States",
-                    "summary": "Senior global business leader in technology, truffle cultivation and trade. Results-driven Stanford MBA with extensive general management experience and technical background. Fluent in English, German, Mandarin Chinese and Japanese.",
-                    "languages": ["English", "German", "Mandarin Chinese", "Japanese", "Spanish"],
-                    "specialties": [
-                        "Market Strategies", "Channel Marketing", "Product Marketing", "Business Development",
-                        "Advertising", "Pricing", "Sales Promotions", "Distribution", "Corporate Communications",
-                        "Alliance/Partnerships", "Contract Negotiations", "Sales Development", "Cross-cultural Teams",
-                        "Team Leadership", "Marketing Management", "Mobile and Wireless", "Branding", "Lead Generation"
-                    ]
-                }
-            }
-            return SuccessResponse(data=default_profile, message="Profile data retrieved successfully")
-        
-        return SuccessResponse(data=profile.dict(), message="Profile data retrieved successfully")
+        rendered = await get_rendered_section("profile")
+        return content_response(request, rendered)
     except Exception as e:
         logger.error(f"Error fetching profile data: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # Experience Routes
 @router.get("/experience")
-async def get_experiences():
+async def get_experiences(request: Request):
     try:
-        experiences = await db_manager.get_experiences()
-        if not experiences:
-            # Return default experience data if none exists
-            default_experiences = [
-                {
-                    "id": "1",
-                    "company": "American Truffle Company",
-                    "position": "Managing Director & Chief Truffle Officer",
-                    "duration": "December 2007 - Present (17 years)",
-                    "location": "San Francisco, California",
-                    "description": "Founded and led innovative truffle cultivation company, developing scientific methods to grow European truffles sustainably. Pioneered ultra-fresh truffle distribution globally.",
-                    "achievements": [
-                        "Established first commercial truffle cultivation operation in North America",
-                        "Developed proprietary scientific methods for truffle cultivation",
-                        "Built global distribution network for ultra-fresh truffles",
-                        "Led company to profitability within 3 years"
-                    ],
-                    "order": 0,
-                    "isActive": True
-                },
-                {
-                    "id": "2",
-                    "company": "ActionRun, Inc.",
-                    "position": "VP of Marketing; CEO",
-                    "duration": "2010 - 2013 (3 years)",
-                    "location": "Silicon Valley, California",
-                    "description": "Led marketing strategy and later served as CEO for mobile technology startup.",
-                    "achievements": [
-                        "Grew user base by 400% in first year as VP Marketing",
-                        "Successfully transitioned to CEO role during critical growth phase",
-                        "Secured Series A funding of $5M",
-                        "Established partnerships with major mobile carriers"
-                    ],
-                    "order": 1,
-                    "isActive": True
-                },
-                {
-                    "id": "3",
-                    "company": "Yahoo!",
-                    "position": "Director of Product Marketing",
-                    "duration": "October 2007 - February 2009 (1 year 5 months)",
-                    "location": "Sunnyvale, California",
-                    "description": "Led product marketing initiatives for Yahoo's core products during critical transformation period.",
-                    "achievements": [
-                        "Managed product marketing for products serving 500M+ users",
-                        "Led cross-functional teams across multiple time zones",
-                        "Developed go-to-market strategies for mobile products",
-                        "Improved user engagement metrics by 35%"
-                    ],
-                    "order": 2,
-                    "isActive": True
-                }
-            ]
-            return SuccessResponse(data=default_experiences, message="Experience data retrieved successfully")
-        
-        return SuccessResponse(data=[exp.dict() for exp in experiences], message="Experience data retrieved successfully")
+        rendered = await get_rendered_section("experience")
+        return content_response(request, rendered)
     except Exception as e:
         logger.error(f"Error fetching experiences: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/experience/bulk", response_model=SuccessResponse, dependencies=[Depends(require_admin)])
+async def bulk_update_experiences(bulk: ExperienceBulkRequest):
+    """Upsert, reorder and soft-delete experiences in one batch (requires X-Admin-Token)"""
+    try:
+        result = await db_manager.bulk_update_experiences(bulk)
+        return SuccessResponse(data=result, message="Experiences updated successfully")
+    except Exception as e:
+        logger.error(f"Error bulk updating experiences: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 # Testimonial Routes
 @router.get("/testimonials")
-async def get_testimonials():
+async def get_testimonials(request: Request):
     try:
-        testimonials = await db_manager.get_testimonials()
-        if not testimonials:
-            # Return default testimonials if none exist
-            default_testimonials = [
-                {
-                    "id": "1",
-                    "name": "Sarah Williams",
-                    "title": "Former CEO, TechVentures",
-                    "content": "Robert's unique combination of technical expertise and business acumen is extraordinary. His ability to bridge cultures and markets made him invaluable to our global expansion.",
-                    "avatar": "https://images.unsplash.com/photo-1494790108755-2616b612b786?w=400&h=400&fit=crop&crop=face",
-                    "order": 0,
-                    "isActive": True
-                },
-                {
-                    "id": "2",
-                    "name": "Dr. Marcus Chen",
-                    "title": "Research Director, Agricultural Sciences",
-                    "content": "Robert's innovative approach to truffle cultivation has revolutionized the industry. His scientific rigor combined with business vision is truly remarkable.",
-                    "avatar": "https://images.unsplash.com/photo-1472099645785-5658abf4ff4e?w=400&h=400&fit=crop&crop=face",
-                    "order": 1,
-                    "isActive": True
-                },
-                {
-                    "id": "3",
-                    "name": "Lisa Park",
-                    "title": "VP Marketing, Global Corp",
-                    "content": "Working with Robert at Yahoo was transformative. His cross-cultural leadership and strategic thinking helped us navigate complex international markets successfully.",
-                    "avatar": "https://images.unsplash.com/photo-1438761681033-6461ffad8d80?w=400&h=400&fit=crop&crop=face",
-                    "order": 2,
-                    "isActive": True
-                }
-            ]
-            return SuccessResponse(data=default_testimonials, message="Testimonials retrieved successfully")
-        
-        return SuccessResponse(data=[test.dict() for test in testimonials], message="Testimonials retrieved successfully")
+        rendered = await get_rendered_section("testimonials")
+        return content_response(request, rendered)
     except Exception as e:
         logger.error(f"Error fetching testimonials: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/testimonials/bulk", response_model=SuccessResponse, dependencies=[Depends(require_admin)])
+async def bulk_update_testimonials(bulk: TestimonialBulkRequest):
+    """Upsert, reorder and soft-delete testimonials in one batch (requires X-Admin-Token)"""
+    try:
+        result = await db_manager.bulk_update_testimonials(bulk)
+        return SuccessResponse(data=result, message="Testimonials updated successfully")
+    except Exception as e:
+        logger.error(f"Error bulk updating testimonials: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 # Truffle Expertise Routes
 @router.get("/expertise")
-async def get_truffle_expertise():
+async def get_truffle_expertise(request: Request):
     try:
-        expertise = await db_manager.get_truffle_expertise()
-        if not expertise:
-            # Return default expertise data if none exists
-            default_expertise = {
-                "title": "Truffle Cultivation Innovation",
-                "subtitle": "Pioneering Scientific Approach to European Truffle Cultivation",
-                "description": "Combining advanced agricultural science with sustainable practices to revolutionize truffle cultivation in North America.",
-                "achievements": [
-                    "First commercial truffle cultivation in North America",
-                    "Proprietary soil microbiome optimization techniques",
-                    "Sustainable harvesting methods preserving ecosystem",
-                    "Global distribution of ultra-fresh truffles within 48 hours",
-                    "Partnership with Michelin-starred restaurants worldwide",
-                    "Scientific publications on truffle mycorrhizal relationships"
-                ],
-                "metrics": [
-                    {"label": "Years of Research", "value": "17+"},
-                    {"label": "Truffle Varieties", "value": "8"},
-                    {"label": "Global Partners", "value": "50+"},
-                    {"label": "Harvest Success Rate", "value": "95%"}
-                ]
-            }
-            return SuccessResponse(data=default_expertise, message="Expertise data retrieved successfully")
-        
-        return SuccessResponse(data=expertise.dict(), message="Expertise data retrieved successfully")
+        rendered = await get_rendered_section("expertise")
+        return content_response(request, rendered)
     except Exception as e:
         logger.error(f"Error fetching truffle expertise: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -1,12 +1,24 @@
 from fastapi import FastAPI, APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
 from dotenv import load_dotenv
+from typing import Optional
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+import asyncio
 import os
 import logging
 from pathlib import Path
 from routes import router as api_router
 from database import db_manager
+from contact_queue import contact_queue
+from content_watcher import content_watcher
+from archival import contact_archiver
+from notifications import contact_notifier
+from health import ReadinessProbe
+from responses import NegotiatingGZipMiddleware
+from metrics import (
+    MetricsMiddleware, render_metrics,
+    content_cache_hits, content_cache_misses, content_cache_entries
+)
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -26,6 +38,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress dynamic responses; content routes send precompressed bodies and are skipped
+app.add_middleware(
+    NegotiatingGZipMiddleware,
+    minimum_size=int(os.environ.get('GZIP_MINIMUM_SIZE', '500')),
+    compresslevel=int(os.environ.get('GZIP_LEVEL', '6'))
+)
+
+# Request counters and latency histograms, exposed on /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,13 +55,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+readiness_probe = ReadinessProbe(
+    db_manager,
+    ttl=float(os.environ.get('READINESS_CACHE_SECONDS', '5')),
+    timeout=float(os.environ.get('READINESS_TIMEOUT_SECONDS', '2'))
+)
+
+# Pool warm-up and index provisioning take several round trips (or a full
+# server-selection timeout when MongoDB is slow to answer), so by default they
+# run alongside the first requests instead of delaying them
+BLOCKING_DB_PREPARE = os.environ.get('STARTUP_BLOCKING_DB_PREPARE', 'false').lower() == 'true'
+prepare_task: Optional[asyncio.Task] = None
+
+async def prepare_database():
+    try:
+        await db_manager.warm_up()
+    except Exception as e:
+        logger.error(f"Database warm-up failed: {str(e)}")
+    try:
+        await db_manager.ensure_indexes()
+    except Exception as e:
+        logger.error(f"Index provisioning failed: {str(e)}")
+
 @app.on_event("startup")
 async def startup_event():
+    global prepare_task
     logger.info("Portfolio API server starting up...")
+    db_manager.connect()
+    if BLOCKING_DB_PREPARE:
+        await prepare_database()
+    else:
+        prepare_task = asyncio.create_task(prepare_database())
+    contact_notifier.start()
+    contact_queue.listeners.append(contact_notifier.notify)
+    await contact_queue.start()
+    content_watcher.start()
+    contact_archiver.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Portfolio API server shutting down...")
+    if prepare_task is not None and not prepare_task.done():
+        prepare_task.cancel()
+    await contact_archiver.stop()
+    await content_watcher.stop()
+    await contact_queue.drain()
+    await contact_notifier.stop()
     await db_manager.close()
 
 # Health check endpoint
@@ -47,11 +108,38 @@ async def shutdown_event():
 async def health_check():
     return {"status": "healthy", "service": "portfolio-api"}
 
+# Readiness probe: 503 while MongoDB is unreachable
+@app.get("/ready")
+async def readiness_check():
+    database = await readiness_probe.check()
+    ready = database["status"] == "ok"
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "degraded",
+            "service": "portfolio-api",
+            "checks": {
+                "database": database,
+                "contactQueue": contact_queue.stats(),
+                "notifications": contact_notifier.stats()
+            }
+        }
+    )
+
+# Prometheus scrape endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    cache = db_manager.cache_stats()
+    content_cache_hits.set(cache["hits"])
+    content_cache_misses.set(cache["misses"])
+    content_cache_entries.set(cache["entries"])
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 # Root endpoint
 @app.get("/")
 async def root():
     return {"message": "Robert Chang Portfolio API", "version": "1.0.0"}
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    from launcher import serve
+    serve()
\ No newline at end of file
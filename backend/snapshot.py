@@ -0,0 +1,98 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Dict
+from compression import HAS_BROTLI
+from content import (
+    SECTIONS, DEFAULT_PROFILE, DEFAULT_EXPERIENCES, DEFAULT_TESTIMONIALS, DEFAULT_EXPERTISE
+)
+from responses import RenderedContent, render_success
+import asyncio
+import hashlib
+import json
+import time
+
+OFFLINE_CONTENT = {
+    "profile": DEFAULT_PROFILE,
+    "experience": DEFAULT_EXPERIENCES,
+    "testimonials": DEFAULT_TESTIMONIALS,
+    "expertise": DEFAULT_EXPERTISE,
+}
+OFFLINE_CONTENT["portfolio"] = dict(OFFLINE_CONTENT)
+
+
+async def render_sections(offline: bool = False) -> Dict[str, RenderedContent]:
+    """Render every content section exactly as the API serves it"""
+    if offline:
+        data = OFFLINE_CONTENT
+    else:
+        sections = [section for section in SECTIONS if section != "portfolio"]
+        results = await asyncio.gather(*[SECTIONS[section][0]() for section in sections])
+        data = dict(zip(sections, results))
+        data["portfolio"] = dict(data)
+    return {
+        section: render_success(data[section], message)
+        for section, (_, message) in SECTIONS.items()
+    }
+
+
+def write_snapshot(rendered: Dict[str, RenderedContent], out_dir: Path, timings: dict = None) -> dict:
+    """Write versioned JSON files with .gz/.br siblings and return the manifest.
+
+    Layout::
+
+        <out_dir>/<version>/<section>.json[.gz|.br]
+        <out_dir>/<version>/manifest.json
+        <out_dir>/latest.json            (copy of the newest manifest)
+
+    The version is a hash of all section bodies, so unchanged content maps
+    onto the same directory and CDN caches stay warm.
+    """
+    timings = timings if timings is not None else {}
+    digest = hashlib.sha256()
+    for section in sorted(rendered):
+        digest.update(rendered[section].body)
+    version = digest.hexdigest()[:12]
+    version_dir = out_dir / version
+    version_dir.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    compress_seconds = 0.0
+    for section, content in rendered.items():
+        start = time.perf_counter()
+        variants = {".json": content.body, ".json.gz": content.encoded("gzip")[0]}
+        if HAS_BROTLI:
+            variants[".json.br"] = content.encoded("br")[0]
+        compress_seconds += time.perf_counter() - start
+
+        for suffix, body in variants.items():
+            (version_dir / f"{section}{suffix}").write_bytes(body)
+        files[section] = {
+            "etag": content.etag,
+            "sizes": {suffix.lstrip("."): len(body) for suffix, body in variants.items()},
+        }
+    timings["compress"] = compress_seconds
+
+    manifest = {
+        "version": version,
+        "generatedAt": datetime.utcnow().isoformat() + "Z",
+        "path": version,
+        "files": files,
+    }
+    manifest_body = json.dumps(manifest, indent=2)
+    (version_dir / "manifest.json").write_text(manifest_body)
+    (out_dir / "latest.json").write_text(manifest_body)
+    return manifest
+
+
+async def build_snapshot(out_dir: Path, offline: bool = False) -> dict:
+    """Render all content and write it to ``out_dir``; returns the manifest with phase timings"""
+    timings = {}
+    start = time.perf_counter()
+    rendered = await render_sections(offline=offline)
+    timings["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    manifest = write_snapshot(rendered, out_dir, timings)
+    timings["write"] = time.perf_counter() - start - timings["compress"]
+    manifest["timings"] = {phase: round(seconds * 1000, 3) for phase, seconds in timings.items()}
+    return manifest
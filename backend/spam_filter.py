@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from models import ContactSubmissionCreate
+from metrics import contact_rejections_total
+import hashlib
+import os
+import re
+
+_WHITESPACE = re.compile(r"\s+")
+_LINK = re.compile(r"https?://|www\.", re.IGNORECASE)
+_WORD = re.compile(r"\w+")
+
+
+class DuplicateSubmissionError(Exception):
+    """The same email, subject and message were already submitted"""
+
+
+class SpamSubmissionError(Exception):
+    """A submission tripped one of the spam heuristics"""
+
+
+def _normalize(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+def fingerprint(submission: ContactSubmissionCreate) -> str:
+    """sha256 of the normalized email, subject and message"""
+    parts = (_normalize(submission.email), _normalize(submission.subject), _normalize(submission.message))
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def repeated_text_ratio(text: str) -> float:
+    """Share of words that repeat an earlier word (0 = all distinct)"""
+    words = _WORD.findall(text.casefold())
+    if not words:
+        return 0.0
+    return 1 - len(set(words)) / len(words)
+
+
+class SpamFilter:
+    """Rejects resubmitted and obviously automated contact submissions before they are queued.
+
+    Fingerprints of recent accepted submissions are kept in a bounded LRU,
+    so a bot replaying one payload from rotating IPs is turned away without
+    touching MongoDB. The unique ``fingerprint`` index in
+    ``contact_submissions`` catches copies this process hasn't seen (other
+    replicas, restarts).
+    """
+
+    def __init__(self, max_entries: int = 10000, max_links: int = 3,
+                 max_repeat_ratio: float = 0.7, min_words_for_ratio: int = 20):
+        self.max_entries = max_entries
+        self.max_links = max_links
+        self.max_repeat_ratio = max_repeat_ratio
+        self.min_words_for_ratio = min_words_for_ratio
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+
+    def check(self, submission: ContactSubmissionCreate) -> str:
+        """Return the submission's fingerprint, or raise if it is a duplicate or spam"""
+        key = fingerprint(submission)
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            contact_rejections_total.inc(reason="duplicate")
+            raise DuplicateSubmissionError("This message was already submitted")
+
+        text = f"{submission.subject} {submission.message}"
+        if len(_LINK.findall(text)) > self.max_links:
+            contact_rejections_total.inc(reason="links")
+            raise SpamSubmissionError("too many links")
+        if len(_WORD.findall(submission.message)) >= self.min_words_for_ratio \
+                and repeated_text_ratio(submission.message) > self.max_repeat_ratio:
+            contact_rejections_total.inc(reason="repetition")
+            raise SpamSubmissionError("repeated text")
+        return key
+
+    def remember(self, key: str):
+        """Record an accepted submission's fingerprint"""
+        self._seen[key] = None
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+spam_filter = SpamFilter(
+    max_entries=int(os.environ.get("SPAM_FILTER_MAX_ENTRIES", "10000")),
+    max_links=int(os.environ.get("SPAM_MAX_LINKS", "3")),
+    max_repeat_ratio=float(os.environ.get("SPAM_MAX_REPEAT_RATIO", "0.7"))
+)
@@ -0,0 +1,44 @@
+from pathlib import Path
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Imported modules read these at import time; nothing connects to them
+os.environ.setdefault("MONGO_URL", "mongodb://127.0.0.1:27017")
+os.environ.setdefault("DB_NAME", "portfolio_test")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db_manager():
+    """The app's DatabaseManager on a fresh in-memory mongomock database"""
+    from mongomock_motor import AsyncMongoMockClient
+    from database import db_manager
+
+    saved = (db_manager.client, db_manager._db)
+    db_manager.client = AsyncMongoMockClient()
+    db_manager._db = db_manager.client["portfolio_test"]
+    db_manager.content_cache.clear()
+    db_manager.stats_cache.clear()
+    yield db_manager
+    db_manager.client, db_manager._db = saved
+    db_manager.content_cache.clear()
+    db_manager.stats_cache.clear()
+
+
+@pytest.fixture
+async def client(db_manager):
+    """HTTP client calling the ASGI app in-process"""
+    import httpx
+    from server import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield http
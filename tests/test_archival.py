@@ -0,0 +1,153 @@
+from bson import ObjectId, json_util
+from datetime import datetime, timedelta
+import gzip
+
+import pytest
+
+from archival import ContactArchiver
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime.utcnow()
+
+
+def make_doc(age_days: float, status: str = "responded", **fields) -> dict:
+    return {
+        "_id": ObjectId(),
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "subject": "Truffle orchard",
+        "message": "Looking for advice on inoculated seedlings.",
+        "inquiryType": "Other",
+        "status": status,
+        "submittedAt": NOW - timedelta(days=age_days),
+        "ipAddress": "203.0.113.9",
+        "userAgent": "Mozilla/5.0",
+        **fields
+    }
+
+
+def archiver(db_manager, **options) -> ContactArchiver:
+    options.setdefault("mode", "collection")
+    options.setdefault("max_age_days", 180)
+    options.setdefault("batch_pause", 0)
+    return ContactArchiver(db_manager, **options)
+
+
+async def ids(collection) -> set:
+    return {doc["_id"] for doc in await collection.find({}, {"_id": 1}).to_list(None)}
+
+
+async def test_only_old_responded_submissions_move(db_manager):
+    old_responded = make_doc(200)
+    docs = [old_responded, make_doc(200, status="new"), make_doc(200, status="read"), make_doc(100)]
+    await db_manager.db.contact_submissions.insert_many(docs)
+
+    result = await archiver(db_manager).run_once()
+
+    assert result == {"archived": 1, "purged": 0}
+    assert await ids(db_manager.db.contact_submissions_archive) == {old_responded["_id"]}
+    assert await ids(db_manager.db.contact_submissions) == {doc["_id"] for doc in docs[1:]}
+
+
+async def test_nothing_is_deleted_when_the_copy_fails(db_manager, monkeypatch):
+    await db_manager.db.contact_submissions.insert_many([make_doc(200), make_doc(300)])
+
+    collection_type = type(db_manager.db.contact_submissions_archive)
+    insert_many = collection_type.insert_many
+
+    async def failing_archive_insert(self, *args, **kwargs):
+        if self.name == "contact_submissions_archive":
+            raise ConnectionError("archive collection unavailable")
+        return await insert_many(self, *args, **kwargs)
+
+    monkeypatch.setattr(collection_type, "insert_many", failing_archive_insert)
+
+    with pytest.raises(ConnectionError):
+        await archiver(db_manager).run_once()
+
+    assert await db_manager.db.contact_submissions.count_documents({}) == 2
+
+
+async def test_rerun_after_partial_copy_tolerates_duplicates(db_manager):
+    docs = [make_doc(200 + day) for day in range(4)]
+    await db_manager.db.contact_submissions.insert_many(docs)
+    # An earlier run copied two documents, then died before deleting them
+    await db_manager.db.contact_submissions_archive.insert_many([dict(doc) for doc in docs[:2]])
+
+    result = await archiver(db_manager).run_once()
+
+    assert result["archived"] == 4
+    assert await db_manager.db.contact_submissions.count_documents({}) == 0
+    assert await ids(db_manager.db.contact_submissions_archive) == {doc["_id"] for doc in docs}
+
+
+async def test_max_batches_caps_one_run(db_manager):
+    await db_manager.db.contact_submissions.insert_many([make_doc(200 + day) for day in range(7)])
+    contact_archiver = archiver(db_manager, batch_size=2, max_batches=2)
+
+    first = await contact_archiver.run_once()
+    assert first["archived"] == 4
+    assert await db_manager.db.contact_submissions.count_documents({}) == 3
+
+    # The oldest go first, and the remainder waits for the next run
+    archived = await db_manager.db.contact_submissions_archive.find().to_list(None)
+    remaining = await db_manager.db.contact_submissions.find().to_list(None)
+    assert max(doc["submittedAt"] for doc in archived) < min(doc["submittedAt"] for doc in remaining)
+
+    second = await contact_archiver.run_once()
+    assert second["archived"] == 3
+    assert contact_archiver.archived == 7
+
+
+async def test_pii_purge_covers_live_and_archived_submissions(db_manager):
+    live_old, live_recent = make_doc(60, status="new"), make_doc(5, status="new")
+    archived_old = make_doc(400)
+    await db_manager.db.contact_submissions.insert_many([live_old, live_recent])
+    await db_manager.db.contact_submissions_archive.insert_one(archived_old)
+
+    result = await archiver(db_manager, mode="off", pii_retention_days=30).run_once()
+
+    assert result == {"archived": 0, "purged": 2}
+    for collection, doc_id in ((db_manager.db.contact_submissions, live_old["_id"]),
+                               (db_manager.db.contact_submissions_archive, archived_old["_id"])):
+        purged = await collection.find_one({"_id": doc_id})
+        assert "ipAddress" not in purged and "userAgent" not in purged
+        assert purged["email"] == "ada@example.com"
+    recent = await db_manager.db.contact_submissions.find_one({"_id": live_recent["_id"]})
+    assert recent["ipAddress"] == "203.0.113.9"
+
+
+async def test_files_mode_writes_monthly_files_without_old_client_info(db_manager, tmp_path):
+    beyond_retention, within_retention = make_doc(200), make_doc(190)
+    await db_manager.db.contact_submissions.insert_many([beyond_retention, within_retention, make_doc(10)])
+
+    result = await archiver(
+        db_manager, mode="files", archive_dir=tmp_path, max_age_days=180, pii_retention_days=195
+    ).run_once()
+
+    assert result["archived"] == 2
+    assert await db_manager.db.contact_submissions.count_documents({}) == 1
+    written = {}
+    for path in tmp_path.glob("contacts-*.jsonl.gz"):
+        month = path.name[len("contacts-"):-len(".jsonl.gz")]
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                doc = json_util.loads(line)
+                assert doc["submittedAt"].strftime("%Y-%m") == month
+                written[doc["_id"]] = doc
+    assert set(written) == {beyond_retention["_id"], within_retention["_id"]}
+    assert "ipAddress" not in written[beyond_retention["_id"]]
+    assert "userAgent" not in written[beyond_retention["_id"]]
+    assert written[within_retention["_id"]]["ipAddress"] == "203.0.113.9"
+
+
+async def test_files_mode_keeps_submissions_when_the_write_fails(db_manager, tmp_path):
+    await db_manager.db.contact_submissions.insert_one(make_doc(200))
+    not_a_directory = tmp_path / "archive"
+    not_a_directory.write_text("")
+
+    with pytest.raises(OSError):
+        await archiver(db_manager, mode="files", archive_dir=not_a_directory).run_once()
+
+    assert await db_manager.db.contact_submissions.count_documents({}) == 1
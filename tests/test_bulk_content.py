@@ -0,0 +1,53 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+TOKEN = "test-admin-token"
+EXPERIENCE = {
+    "id": "651111111111111111111111",
+    "company": "Mycorrhiza Labs",
+    "position": "Founder",
+    "duration": "2020 - now",
+    "description": "Truffle orchards"
+}
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", TOKEN)
+    return TOKEN
+
+
+async def test_bulk_routes_are_disabled_without_admin_token(client, monkeypatch):
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+
+    for path in ("/api/experience/bulk", "/api/testimonials/bulk"):
+        response = await client.post(path, json={}, headers={"X-Admin-Token": ""})
+        assert response.status_code == 403
+
+
+@pytest.mark.parametrize("headers, status", [
+    ({}, 401),
+    ({"X-Admin-Token": "wrong"}, 403),
+    ({"X-Admin-Token": TOKEN + "x"}, 403),
+])
+async def test_bulk_routes_reject_missing_or_wrong_tokens(client, db_manager, admin_token, headers, status):
+    response = await client.post("/api/experience/bulk", json={"upsert": [EXPERIENCE]}, headers=headers)
+
+    assert response.status_code == status
+    assert await db_manager.db.experiences.count_documents({}) == 0
+
+
+async def test_upsert_creates_unknown_ids_and_updates_known_ones(client, db_manager, admin_token):
+    headers = {"X-Admin-Token": admin_token}
+
+    created = await client.post("/api/experience/bulk", json={"upsert": [EXPERIENCE]}, headers=headers)
+    updated = await client.post(
+        "/api/experience/bulk", json={"upsert": [{**EXPERIENCE, "position": "CEO"}]}, headers=headers
+    )
+
+    assert created.json()["data"]["upsertedIds"] == [EXPERIENCE["id"]]
+    assert updated.json()["data"]["upsertedIds"] == []
+    assert updated.json()["data"]["matched"] == 1
+    served = (await client.get("/api/experience")).json()["data"]
+    assert [(item["id"], item["position"]) for item in served] == [(EXPERIENCE["id"], "CEO")]
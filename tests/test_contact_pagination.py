@@ -0,0 +1,110 @@
+from bson import ObjectId
+from datetime import datetime, timedelta
+import base64
+import json
+
+import pytest
+
+from models import InquiryType, SubmissionStatus
+
+pytestmark = pytest.mark.anyio
+
+BASE_TIME = datetime(2024, 3, 1, 12, 0, 0)
+
+
+async def seed(db_manager, timestamps) -> list:
+    """Insert one submission per timestamp; returns their ids newest first, ties by _id descending"""
+    docs = []
+    for position, submitted_at in enumerate(timestamps):
+        docs.append({
+            "_id": ObjectId(),
+            "name": f"Sender {position}",
+            "email": f"sender{position}@example.com",
+            "subject": "Hello",
+            "message": "A message long enough to be valid.",
+            "inquiryType": InquiryType.OTHER.value if position % 2 else InquiryType.CONSULTING_SERVICES.value,
+            "status": SubmissionStatus.NEW.value,
+            "submittedAt": submitted_at
+        })
+    await db_manager.db.contact_submissions.insert_many(docs)
+    ordered = sorted(docs, key=lambda doc: (doc["submittedAt"], doc["_id"]), reverse=True)
+    return [str(doc["_id"]) for doc in ordered]
+
+
+async def collect_pages(db_manager, limit, **filters):
+    pages, cursor = [], None
+    while True:
+        items, cursor = await db_manager.get_contact_submissions(limit=limit, cursor=cursor, **filters)
+        pages.append([item["id"] for item in items])
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7, 50])
+async def test_pages_cover_tied_timestamps_exactly_once(db_manager, limit):
+    # Three submissions share each timestamp, so page boundaries fall inside ties
+    timestamps = [BASE_TIME - timedelta(minutes=minute) for minute in range(3) for _ in range(3)]
+    expected = await seed(db_manager, timestamps)
+
+    pages = await collect_pages(db_manager, limit)
+
+    assert [item for page in pages for item in page] == expected
+    assert all(len(page) == limit for page in pages[:-1])
+
+
+async def test_last_full_page_has_no_cursor(db_manager):
+    await seed(db_manager, [BASE_TIME] * 4)
+
+    items, cursor = await db_manager.get_contact_submissions(limit=4)
+
+    assert len(items) == 4
+    assert cursor is None
+
+
+async def test_filters_apply_on_every_page(db_manager):
+    await seed(db_manager, [BASE_TIME] * 6)
+
+    pages = await collect_pages(db_manager, 2, inquiry_type=InquiryType.OTHER.value)
+
+    ids = [item for page in pages for item in page]
+    stored = await db_manager.db.contact_submissions.find({"inquiryType": InquiryType.OTHER.value}).to_list(None)
+    assert sorted(ids) == sorted(str(doc["_id"]) for doc in stored)
+
+
+async def test_projection_keeps_cursor_fields(db_manager):
+    await seed(db_manager, [BASE_TIME - timedelta(seconds=second) for second in range(3)])
+
+    items, cursor = await db_manager.get_contact_submissions(limit=2, fields=["email"])
+
+    assert [set(item) for item in items] == [{"id", "email"}] * 2
+    assert cursor is not None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    base64.urlsafe_b64encode(json.dumps({"t": "yesterday", "i": "x"}).encode()).decode(),
+    base64.urlsafe_b64encode(json.dumps({"i": str(ObjectId())}).encode()).decode(),
+    base64.urlsafe_b64encode(json.dumps(["t", "i"]).encode()).decode(),
+])
+async def test_invalid_cursor_is_rejected(db_manager, cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        await db_manager.get_contact_submissions(limit=2, cursor=cursor)
+
+
+async def test_invalid_cursor_is_a_400(client):
+    response = await client.get("/api/contact", params={"cursor": "bogus"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+async def test_route_pages_with_next_cursor(client, db_manager):
+    expected = await seed(db_manager, [BASE_TIME] * 3)
+
+    first = (await client.get("/api/contact", params={"limit": 2})).json()
+    second = (await client.get("/api/contact", params={"limit": 2, "cursor": first["nextCursor"]})).json()
+
+    assert [item["id"] for item in first["items"] + second["items"]] == expected
+    assert first["total"] == 3
+    assert second["nextCursor"] is None
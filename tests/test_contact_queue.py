@@ -0,0 +1,179 @@
+from bson import ObjectId, json_util
+from datetime import datetime
+import asyncio
+
+import pytest
+
+from contact_queue import ContactWriteQueue
+from models import ContactSubmission, InquiryType
+
+pytestmark = pytest.mark.anyio
+
+
+def make_submission(**overrides) -> ContactSubmission:
+    fields = {
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "subject": "Truffle orchard",
+        "message": "Looking for advice on inoculated seedlings.",
+        "inquiryType": InquiryType.CONSULTING_SERVICES,
+        **overrides
+    }
+    return ContactSubmission(**fields)
+
+
+def make_doc(**overrides) -> dict:
+    """A queued document as ContactWriteQueue.submit builds it"""
+    extra = {key: overrides.pop(key) for key in ("_id", "fingerprint") if key in overrides}
+    doc = make_submission(**overrides).dict()
+    doc["_id"] = ObjectId()
+    doc.update(extra)
+    return doc
+
+
+def read_spill(path) -> list:
+    with open(path, encoding="utf-8") as spill:
+        return [json_util.loads(line) for line in spill if line.strip()]
+
+
+class FailingDatabase:
+    """Rejects every insert, like a MongoDB that is down"""
+
+    def __init__(self):
+        self.attempts = 0
+
+    async def insert_contact_documents(self, docs):
+        self.attempts += 1
+        raise ConnectionError("MongoDB unavailable")
+
+
+class BlockingDatabase:
+    """Never finishes an insert, so drain() has to give up on it"""
+
+    async def insert_contact_documents(self, docs):
+        await asyncio.Event().wait()
+
+
+@pytest.fixture
+def spill_path(tmp_path):
+    return tmp_path / "contact_spill.jsonl"
+
+
+async def test_failed_flush_spills_and_next_start_replays(db_manager, spill_path):
+    queue = ContactWriteQueue(FailingDatabase(), flush_interval=0.01, max_attempts=1, spill_path=spill_path)
+    await queue.start()
+    doc_id = await queue.submit(make_submission())
+    await queue.drain()
+
+    spilled = read_spill(spill_path)
+    assert [str(doc["_id"]) for doc in spilled] == [doc_id]
+
+    replaying = ContactWriteQueue(db_manager, spill_path=spill_path)
+    await replaying.start()
+    await replaying.drain()
+
+    stored = await db_manager.db.contact_submissions.find().to_list(None)
+    assert [str(doc["_id"]) for doc in stored] == [doc_id]
+    assert not spill_path.exists()
+    assert not spill_path.with_suffix(".replay").exists()
+
+
+async def test_replay_ignores_documents_already_stored(db_manager, spill_path):
+    already_stored = make_doc()
+    await db_manager.db.contact_submissions.insert_one(dict(already_stored))
+    fresh = make_doc(subject="Second message")
+    queue = ContactWriteQueue(db_manager, spill_path=spill_path)
+    queue._append_spill([already_stored, fresh])
+
+    await queue.start()
+    await queue.drain()
+
+    stored = await db_manager.db.contact_submissions.find().sort("subject", 1).to_list(None)
+    assert [doc["_id"] for doc in stored] == [fresh["_id"], already_stored["_id"]]
+    assert not spill_path.exists()
+
+
+async def test_interrupted_replay_file_is_merged_with_new_spill(db_manager, spill_path):
+    left_over, spilled_later = make_doc(), make_doc(subject="Later")
+    queue = ContactWriteQueue(db_manager, spill_path=spill_path)
+    queue._append_spill([left_over])
+    spill_path.replace(spill_path.with_suffix(".replay"))
+    queue._append_spill([spilled_later])
+
+    taken = queue._take_spill()
+
+    assert [doc["_id"] for doc in taken] == [left_over["_id"], spilled_later["_id"]]
+    assert not spill_path.exists()
+    assert not spill_path.with_suffix(".replay").exists()
+
+
+async def test_take_spill_without_file_is_empty(spill_path):
+    queue = ContactWriteQueue(FailingDatabase(), spill_path=spill_path)
+
+    assert queue._take_spill() == []
+
+
+async def test_fingerprint_clash_is_dropped_and_not_notified(db_manager, spill_path):
+    collection = db_manager.db.contact_submissions
+    await collection.create_index("fingerprint", unique=True, sparse=True)
+    await collection.insert_one(make_doc(fingerprint="abc"))
+    resubmitted, other = make_doc(fingerprint="abc"), make_doc(fingerprint="def")
+    notified = []
+    queue = ContactWriteQueue(db_manager, spill_path=spill_path)
+    queue.listeners.append(notified.extend)
+
+    stored = await queue._insert([resubmitted, other])
+
+    assert [doc["_id"] for doc in stored] == [other["_id"]]
+    assert [doc["_id"] for doc in notified] == [other["_id"]]
+    assert await collection.count_documents({}) == 2
+
+
+async def test_duplicate_id_counts_as_stored_but_is_not_notified_again(db_manager, spill_path):
+    doc, fresh = make_doc(), make_doc(subject="Second message")
+    await db_manager.db.contact_submissions.insert_one(dict(doc))
+    notified = []
+    queue = ContactWriteQueue(db_manager, spill_path=spill_path)
+    queue.listeners.append(notified.append)
+
+    stored = await queue._insert([doc, fresh])
+
+    assert [stored_doc["_id"] for stored_doc in stored] == [doc["_id"], fresh["_id"]]
+    assert [[notified_doc["_id"] for notified_doc in batch] for batch in notified] == [[fresh["_id"]]]
+
+
+async def test_replay_of_stored_batch_notifies_nobody(db_manager, spill_path):
+    docs = [make_doc(), make_doc(subject="Second message")]
+    await db_manager.db.contact_submissions.insert_many([dict(doc) for doc in docs])
+    notified = []
+    queue = ContactWriteQueue(db_manager, spill_path=spill_path)
+    queue.listeners.append(notified.append)
+    queue._append_spill(docs)
+
+    await queue._replay_spill()
+
+    assert notified == []
+
+
+async def test_drain_spills_what_could_not_be_written(spill_path):
+    queue = ContactWriteQueue(BlockingDatabase(), batch_size=2, flush_interval=0.01, spill_path=spill_path)
+    await queue.start()
+    submission = make_submission()
+    ids = [await queue.submit(submission) for _ in range(5)]
+    await asyncio.sleep(0.05)
+
+    await queue.drain(timeout=0.1)
+
+    assert sorted(str(doc["_id"]) for doc in read_spill(spill_path)) == sorted(ids)
+    assert not queue.running
+
+
+async def test_submit_without_worker_writes_through(db_manager, spill_path):
+    queue = ContactWriteQueue(db_manager, spill_path=spill_path)
+    submission = make_submission(submittedAt=datetime(2024, 5, 1))
+
+    doc_id = await queue.submit(submission, fingerprint="xyz")
+
+    stored = await db_manager.db.contact_submissions.find_one({"_id": ObjectId(doc_id)})
+    assert stored["fingerprint"] == "xyz"
+    assert stored["submittedAt"] == datetime(2024, 5, 1)
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import time
+
+import pytest
+
+import cache
+from models import InquiryType, SubmissionStatus
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime.utcnow().replace(hour=12, minute=0, second=0, microsecond=0)
+
+
+def make_doc(age_days: int, inquiry_type: str = "Other", status: str = "new") -> dict:
+    return {
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "subject": "Truffle orchard",
+        "message": "Looking for advice on inoculated seedlings.",
+        "inquiryType": inquiry_type,
+        "status": status,
+        "submittedAt": NOW - timedelta(days=age_days),
+    }
+
+
+def iso_week(age_days: int) -> str:
+    year, week, _ = (NOW - timedelta(days=age_days)).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+async def get_stats(client, **params) -> dict:
+    response = await client.get("/api/contact/stats", params=params)
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+async def test_stats_shape_and_zero_filled_keys(client, db_manager):
+    await db_manager.db.contact_submissions.insert_many([
+        make_doc(1, "Consulting Services"),
+        make_doc(2, "Consulting Services", status="read"),
+        make_doc(3, "Other", status="responded"),
+        # Outside the 30 day window
+        make_doc(45, "Business Partnership"),
+    ])
+
+    stats = await get_stats(client, days=30)
+
+    assert set(stats) == {"since", "bucket", "total", "byInquiryType", "byStatus", "timeline"}
+    assert stats["bucket"] == "day"
+    assert stats["since"].endswith("Z")
+    assert stats["total"] == 3
+    assert stats["byInquiryType"] == {
+        **{inquiry_type.value: 0 for inquiry_type in InquiryType},
+        "Consulting Services": 2,
+        "Other": 1,
+    }
+    assert stats["byStatus"] == {
+        **{status.value: 0 for status in SubmissionStatus},
+        "new": 1,
+        "read": 1,
+        "responded": 1,
+    }
+
+
+async def test_empty_window_is_all_zeros(client, db_manager):
+    stats = await get_stats(client, days=7)
+
+    assert stats["total"] == 0
+    assert set(stats["byInquiryType"]) == {inquiry_type.value for inquiry_type in InquiryType}
+    assert not any(stats["byInquiryType"].values())
+    assert set(stats["byStatus"]) == {status.value for status in SubmissionStatus}
+    assert not any(stats["byStatus"].values())
+    assert stats["timeline"] == []
+
+
+async def test_day_buckets(client, db_manager):
+    await db_manager.db.contact_submissions.insert_many([make_doc(1), make_doc(1), make_doc(4)])
+
+    stats = await get_stats(client, days=30, bucket="day")
+
+    assert stats["timeline"] == [
+        {"period": (NOW - timedelta(days=4)).strftime("%Y-%m-%d"), "count": 1},
+        {"period": (NOW - timedelta(days=1)).strftime("%Y-%m-%d"), "count": 2},
+    ]
+
+
+async def test_week_buckets_use_iso_weeks(client, db_manager):
+    ages = [1, 2, 8, 15, 16, 17]
+    await db_manager.db.contact_submissions.insert_many([make_doc(age) for age in ages])
+
+    stats = await get_stats(client, days=30, bucket="week")
+
+    expected = {}
+    for age in ages:
+        expected[iso_week(age)] = expected.get(iso_week(age), 0) + 1
+    assert stats["bucket"] == "week"
+    assert stats["timeline"] == [{"period": period, "count": count} for period, count in sorted(expected.items())]
+
+
+async def test_unknown_bucket_is_rejected(client, db_manager):
+    response = await client.get("/api/contact/stats", params={"bucket": "month"})
+
+    assert response.status_code == 422
+
+
+async def test_results_are_cached_for_30_seconds(client, db_manager, monkeypatch):
+    await db_manager.db.contact_submissions.insert_one(make_doc(1))
+    assert (await get_stats(client, days=30))["total"] == 1
+
+    await db_manager.db.contact_submissions.insert_one(make_doc(2))
+    assert (await get_stats(client, days=30))["total"] == 1
+    # Cached per (days, bucket)
+    assert (await get_stats(client, days=31))["total"] == 2
+    assert (await get_stats(client, days=30, bucket="week"))["total"] == 2
+
+    later = time.monotonic() + 31
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: later))
+    assert (await get_stats(client, days=30))["total"] == 2
@@ -0,0 +1,174 @@
+from bson import ObjectId
+from datetime import datetime
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+
+from database import decode_contact, decode_experience, decode_expertise, decode_profile, decode_testimonial
+
+SUBMITTED_AT = datetime(2024, 2, 1, 9, 30)
+
+# Complete documents as DatabaseManager stores them
+DOCUMENTS = {
+    "contact": (decode_contact, {
+        "_id": ObjectId(),
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "subject": "Truffle orchard",
+        "message": "Looking for advice on inoculated seedlings.",
+        "inquiryType": "Consulting Services",
+        "submittedAt": SUBMITTED_AT,
+        "status": "read",
+        "ipAddress": "203.0.113.9",
+        "userAgent": "Mozilla/5.0",
+        "fingerprint": "f" * 64
+    }),
+    "profile": (decode_profile, {
+        "_id": ObjectId(),
+        "personal": {
+            "name": "Robert Chang",
+            "title": "Founder",
+            "company": "Truffle Co",
+            "location": "Oregon",
+            "summary": "Grower",
+            "languages": ["English"],
+            "specialties": ["Truffles"]
+        },
+        "updatedAt": SUBMITTED_AT
+    }),
+    "experience": (decode_experience, {
+        "_id": ObjectId(),
+        "company": "Mycorrhiza Labs",
+        "position": "Founder",
+        "duration": "2020 - now",
+        "location": None,
+        "description": "Truffle orchards",
+        "achievements": ["First harvest"],
+        "order": 2,
+        "isActive": True
+    }),
+    "testimonial": (decode_testimonial, {
+        "_id": ObjectId(),
+        "name": "Grace Hopper",
+        "title": "Admiral",
+        "content": "Remarkable truffles, every season.",
+        "avatar": None,
+        "order": 0,
+        "isActive": True
+    }),
+    "expertise": (decode_expertise, {
+        "_id": ObjectId(),
+        "title": "Truffle cultivation",
+        "subtitle": "Since 2005",
+        "description": "Orchards across three states",
+        "achievements": ["Black Perigord"],
+        "metrics": [{"label": "Orchards", "value": "12"}],
+        "updatedAt": SUBMITTED_AT
+    }),
+}
+
+# Optional fields with a static default, dropped to check the decoder fills them in
+OPTIONAL_FIELDS = {
+    "contact": ["status", "ipAddress", "userAgent"],
+    "profile": [],
+    "experience": [],
+    "testimonial": [],
+    "expertise": [],
+}
+
+# Fields whose default comes from a factory (fresh uuid or timestamp)
+FACTORY_FIELDS = {
+    "contact": {"submittedAt": datetime},
+    "profile": {"updatedAt": datetime},
+    "experience": {},
+    "testimonial": {},
+    "expertise": {"updatedAt": datetime},
+}
+
+
+def model_path(decoder, doc: dict) -> dict:
+    """What the code did before DocumentDecoder: validate, then dump"""
+    return decoder.model(**{**doc, "id": str(doc["_id"])}).dict()
+
+
+def as_json(value) -> str:
+    return json.dumps(jsonable_encoder(value))
+
+
+@pytest.mark.parametrize("kind", DOCUMENTS)
+def test_matches_the_model_path(kind):
+    decoder, doc = DOCUMENTS[kind]
+
+    decoded = decoder(dict(doc))
+
+    assert list(decoded) == list(decoder.model.model_fields)
+    assert as_json(decoded) == as_json(model_path(decoder, doc))
+    assert decoded["id"] == str(doc["_id"])
+
+
+@pytest.mark.parametrize("kind", DOCUMENTS)
+def test_missing_static_defaults_match_the_model_path(kind):
+    decoder, doc = DOCUMENTS[kind]
+    partial = {key: value for key, value in doc.items() if key not in OPTIONAL_FIELDS[kind]}
+
+    assert as_json(decoder(dict(partial))) == as_json(model_path(decoder, partial))
+
+
+@pytest.mark.parametrize("kind", [kind for kind in DOCUMENTS if FACTORY_FIELDS[kind]])
+def test_missing_factory_defaults_are_generated(kind):
+    decoder, doc = DOCUMENTS[kind]
+    partial = {key: value for key, value in doc.items() if key not in FACTORY_FIELDS[kind]}
+
+    decoded = decoder(dict(partial))
+    expected = model_path(decoder, partial)
+
+    for field, field_type in FACTORY_FIELDS[kind].items():
+        assert isinstance(decoded[field], field_type)
+        del decoded[field], expected[field]
+    assert as_json(decoded) == as_json(expected)
+
+
+def test_document_without_id_gets_a_generated_one():
+    decoder, doc = DOCUMENTS["experience"]
+    without_id = {key: value for key, value in doc.items() if key != "_id"}
+
+    decoded = decoder(dict(without_id))
+
+    assert isinstance(decoded["id"], str) and decoded["id"]
+
+
+@pytest.mark.parametrize("kind, missing", [
+    ("contact", "email"),
+    ("profile", "personal"),
+    ("experience", "company"),
+    ("testimonial", "content"),
+    ("expertise", "metrics"),
+])
+def test_missing_required_field_falls_back_to_validation(kind, missing):
+    decoder, doc = DOCUMENTS[kind]
+    broken = {key: value for key, value in doc.items() if key != missing}
+
+    with pytest.raises(ValidationError) as error:
+        decoder(dict(broken))
+
+    assert missing in str(error.value)
+
+
+def test_fallback_validates_the_whole_document():
+    decoder, doc = DOCUMENTS["contact"]
+    broken = {key: value for key, value in doc.items() if key != "email"}
+    broken["inquiryType"] = "Not a real type"
+
+    with pytest.raises(ValidationError) as error:
+        decoder(dict(broken))
+
+    assert {tuple(item["loc"]) for item in error.value.errors()} == {("email",), ("inquiryType",)}
+
+
+def test_many_and_one():
+    decoder, doc = DOCUMENTS["testimonial"]
+
+    assert decoder.one(None) is None
+    assert decoder.many([dict(doc), dict(doc)]) == [decoder(dict(doc))] * 2
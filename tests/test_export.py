@@ -0,0 +1,88 @@
+from datetime import datetime
+import csv
+import io
+import json
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+TOKEN = "test-admin-token"
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", TOKEN)
+    return TOKEN
+
+
+async def seed(db_manager, **fields):
+    doc = {
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "subject": "Truffle orchard",
+        "message": "Looking for advice on inoculated seedlings.",
+        "inquiryType": "Other",
+        "status": "new",
+        "submittedAt": datetime(2024, 2, 1, 9, 30),
+        "ipAddress": "203.0.113.9",
+        "userAgent": "Mozilla/5.0",
+        **fields
+    }
+    await db_manager.db.contact_submissions.insert_one(doc)
+
+
+async def test_export_is_disabled_without_admin_token(client, db_manager, monkeypatch):
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    await seed(db_manager)
+
+    response = await client.get("/api/contact/export")
+
+    assert response.status_code == 403
+    assert "ada@example.com" not in response.text
+
+
+@pytest.mark.parametrize("headers, status", [
+    ({}, 401),
+    ({"X-Admin-Token": "wrong"}, 403),
+])
+async def test_export_rejects_missing_or_wrong_tokens(client, db_manager, admin_token, headers, status):
+    await seed(db_manager)
+
+    response = await client.get("/api/contact/export", params={"format": "csv"}, headers=headers)
+
+    assert response.status_code == status
+    assert "ada@example.com" not in response.text
+
+
+async def test_ndjson_export_with_token(client, db_manager, admin_token):
+    await seed(db_manager, subject="=HYPERLINK(\"http://evil\")")
+
+    response = await client.get("/api/contact/export", headers={"X-Admin-Token": admin_token})
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["email"] for row in rows] == ["ada@example.com"]
+    # NDJSON is not opened by spreadsheets, so values are exported as stored
+    assert rows[0]["subject"] == "=HYPERLINK(\"http://evil\")"
+
+
+@pytest.mark.parametrize("text", ["=1+1", "+1", "-1", "@SUM(A1)", "\tcmd", "\rcmd"])
+async def test_csv_export_neutralises_formulas(client, db_manager, admin_token, text):
+    await seed(db_manager, name=text, subject=text)
+
+    response = await client.get("/api/contact/export", params={"format": "csv"}, headers={"X-Admin-Token": admin_token})
+
+    row = next(csv.DictReader(io.StringIO(response.text)))
+    assert row["name"] == "'" + text
+    assert row["subject"] == "'" + text
+
+
+async def test_csv_export_leaves_plain_text_alone(client, db_manager, admin_token):
+    await seed(db_manager, subject="Hello = world")
+
+    response = await client.get("/api/contact/export", params={"format": "csv"}, headers={"X-Admin-Token": admin_token})
+
+    row = next(csv.DictReader(io.StringIO(response.text)))
+    assert row["subject"] == "Hello = world"
+    assert row["submittedAt"] == "2024-02-01T09:30:00"
@@ -0,0 +1,57 @@
+import logging
+
+import pytest
+from pymongo.errors import OperationFailure
+
+import database
+from indexes import ensure_indexes
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_obsolete_index_is_dropped(db_manager):
+    await db_manager.db.contact_submissions.create_index("submittedAt", name="by_submitted_at")
+
+    await ensure_indexes(db_manager.db)
+
+    assert "by_submitted_at" not in await db_manager.db.contact_submissions.index_information()
+
+
+async def test_obsolete_index_dropped_by_another_worker(db_manager, monkeypatch, caplog):
+    await db_manager.db.contact_submissions.create_index("submittedAt", name="by_submitted_at")
+    collection_type = type(db_manager.db.contact_submissions)
+    drop_index = collection_type.drop_index
+
+    async def lose_the_race(self, name, *args, **kwargs):
+        # Another worker drops the index between index_information() and our drop
+        await drop_index(self, name, *args, **kwargs)
+        raise OperationFailure(f"index not found with name [{name}]", code=27)
+
+    checked = []
+
+    async def check_query_plans(db):
+        checked.append(db)
+        return []
+
+    monkeypatch.setattr(collection_type, "drop_index", lose_the_race)
+    monkeypatch.setattr(database, "check_query_plans", check_query_plans)
+
+    await db_manager.ensure_indexes()
+
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+    # Losing the race must not stop the rest of startup provisioning
+    assert checked == [db_manager.db]
+
+
+async def test_other_drop_failures_are_logged(db_manager, monkeypatch, caplog):
+    await db_manager.db.contact_submissions.create_index("submittedAt", name="by_submitted_at")
+    collection_type = type(db_manager.db.contact_submissions)
+
+    async def unauthorized(self, name, *args, **kwargs):
+        raise OperationFailure("not authorized to drop indexes", code=13)
+
+    monkeypatch.setattr(collection_type, "drop_index", unauthorized)
+
+    await ensure_indexes(db_manager.db)
+
+    assert any("Could not drop obsolete index by_submitted_at" in record.getMessage() for record in caplog.records)
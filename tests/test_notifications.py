@@ -0,0 +1,96 @@
+from bson import ObjectId
+from datetime import datetime
+
+import pytest
+
+from notifications import ContactNotifier, PermanentNotificationError, format_notification, single_line
+
+SUBMISSION = {
+    "name": "Eve\r\nBcc: victim@example.com",
+    "email": "eve@example.com",
+    "inquiryType": "Other",
+    "subject": "Hello\nthere\x00\tfriend",
+    "message": "Line one\nLine two"
+}
+
+
+class RecordingTransport:
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = 0
+
+    def send(self, subject, body, submissions):
+        self.calls += 1
+        if self.error:
+            raise self.error
+
+
+def test_single_line_collapses_control_characters_and_truncates():
+    assert single_line(" a\r\n b\t\x00c ") == "a b c"
+    assert single_line("x" * 300, limit=10) == "x" * 9 + "…"
+
+
+def test_user_text_never_breaks_header_lines():
+    subject, body = format_notification([SUBMISSION])
+    digest_subject, digest = format_notification([SUBMISSION, SUBMISSION])
+
+    assert subject == "[Portfolio] Other: Hello there friend"
+    assert body.splitlines()[0] == "From: Eve Bcc: victim@example.com <eve@example.com>"
+    assert "Line one\nLine two" in body
+    assert digest_subject == "[Portfolio] 2 new contact submissions"
+    assert digest.splitlines() == ["- Eve Bcc: victim@example.com <eve@example.com> (Other): Hello there friend"] * 2
+
+
+@pytest.mark.anyio
+async def test_permanent_errors_are_not_retried():
+    transport = RecordingTransport(PermanentNotificationError("malformed"))
+    notifier = ContactNotifier(transport, max_attempts=5)
+
+    await notifier._send([SUBMISSION], notifier.max_attempts)
+
+    assert transport.calls == 1
+    assert notifier.failed == 1
+
+
+@pytest.mark.anyio
+async def test_transient_errors_are_retried(monkeypatch):
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr("notifications.asyncio.sleep", no_sleep)
+    transport = RecordingTransport(ConnectionError("smtp down"))
+    notifier = ContactNotifier(transport, max_attempts=3)
+
+    await notifier._send([SUBMISSION], notifier.max_attempts)
+
+    assert transport.calls == 3
+    assert notifier.failed == 1
+
+
+@pytest.mark.anyio
+async def test_notifications_carry_only_what_the_owner_needs():
+    notifier = ContactNotifier(RecordingTransport())
+    notifier.start()
+    stored = {
+        **SUBMISSION,
+        "_id": ObjectId(),
+        "submittedAt": datetime(2024, 2, 1, 9, 30),
+        "status": "new",
+        "ipAddress": "203.0.113.9",
+        "userAgent": "Mozilla/5.0",
+        "fingerprint": "0" * 64
+    }
+
+    notifier.notify([stored])
+    entry = notifier._queue.get_nowait()
+    await notifier.stop()
+
+    assert entry == {
+        "id": str(stored["_id"]),
+        "name": SUBMISSION["name"],
+        "email": "eve@example.com",
+        "subject": SUBMISSION["subject"],
+        "message": SUBMISSION["message"],
+        "inquiryType": "Other",
+        "submittedAt": "2024-02-01T09:30:00"
+    }
@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from rate_limit import MemoryRateLimitBackend, RateLimit, SlidingWindowLimiter, _retry_after
+
+EPSILON = 1e-6
+
+
+def test_allows_up_to_the_limit_within_a_window():
+    limiter = SlidingWindowLimiter(limit=3, window=60)
+
+    decisions = [limiter.hit("1.2.3.4", now=second)[0] for second in (0, 1, 2, 3)]
+
+    assert decisions == [True, True, True, False]
+
+
+def test_keys_are_limited_independently():
+    limiter = SlidingWindowLimiter(limit=1, window=60)
+
+    assert limiter.hit("a", now=0)[0]
+    assert limiter.hit("b", now=0)[0]
+    assert not limiter.hit("a", now=1)[0]
+
+
+def test_rejected_hits_are_not_counted():
+    limiter = SlidingWindowLimiter(limit=2, window=60)
+    limiter.hit("ip", now=0)
+    limiter.hit("ip", now=1)
+    for second in range(2, 50):
+        assert not limiter.hit("ip", now=second)[0]
+
+    # Only the two accepted hits carry into the next window: 2 * (1 - 0.5) = 1 < 2
+    assert limiter.hit("ip", now=90)[0]
+
+
+def test_previous_window_is_weighted_by_overlap():
+    limiter = SlidingWindowLimiter(limit=3, window=60)
+    for second in (10, 20, 30):
+        limiter.hit("ip", now=second)
+
+    # 10s into the next window: 3 * 50/60 = 2.5 hits still count
+    assert limiter.hit("ip", now=70)[0]
+    # Now 3 * 49/60 + 1 >= 3
+    assert not limiter.hit("ip", now=71)[0]
+
+
+def test_history_older_than_two_windows_is_forgotten():
+    limiter = SlidingWindowLimiter(limit=1, window=60)
+    limiter.hit("ip", now=59)
+
+    assert limiter.hit("ip", now=120)[0]
+
+
+@pytest.mark.parametrize("hits, rejected_at", [
+    # Current window full on its own: retry at the next boundary
+    ((0, 1, 2), 3),
+    ((50, 55, 59.5), 59.9),
+    # Partly spent previous window plus hits in the current one
+    ((10, 20, 30, 70), 71),
+    ((0, 0, 0, 61), 62),
+])
+def test_retry_after_points_at_the_first_allowed_moment(hits, rejected_at):
+    limiter = SlidingWindowLimiter(limit=3, window=60)
+    for now in hits:
+        assert limiter.hit("ip", now=now)[0]
+
+    allowed, retry_after = limiter.hit("ip", now=rejected_at)
+    assert not allowed
+    assert retry_after > 0
+
+    probe = SlidingWindowLimiter(limit=3, window=60)
+    for now in hits:
+        probe.hit("ip", now=now)
+    assert not probe.hit("ip", now=rejected_at + retry_after - 0.5)[0]
+
+    probe = SlidingWindowLimiter(limit=3, window=60)
+    for now in hits:
+        probe.hit("ip", now=now)
+    assert probe.hit("ip", now=rejected_at + retry_after + EPSILON)[0]
+
+
+def test_retry_after_at_window_boundaries():
+    # Full current window, checked at its very start and very end
+    assert _retry_after(limit=3, window=60, current=3, previous=0, elapsed=0.0) == pytest.approx(60)
+    assert _retry_after(limit=3, window=60, current=3, previous=0, elapsed=59 / 60) == pytest.approx(1)
+    # Full previous window right at the boundary: allowed as soon as any of it slides out
+    assert _retry_after(limit=3, window=60, current=0, previous=3, elapsed=0.0) == pytest.approx(0)
+    assert _retry_after(limit=3, window=60, current=1, previous=3, elapsed=0.0) == pytest.approx(20)
+
+
+def test_idle_keys_are_evicted_and_size_is_bounded():
+    limiter = SlidingWindowLimiter(limit=5, window=60, max_keys=3)
+    for key in "abcd":
+        limiter.hit(key, now=0)
+    assert len(limiter) == 3
+
+    limiter.hit("e", now=180)
+    assert len(limiter) == 1
+
+
+@pytest.mark.anyio
+async def test_dependency_answers_429_with_retry_after():
+    limit = RateLimit("test_scope", limit=1, window=60, backend=MemoryRateLimitBackend())
+    request = SimpleNamespace(client=SimpleNamespace(host="203.0.113.9"))
+
+    await limit(request)
+    with pytest.raises(HTTPException) as rejected:
+        await limit(request)
+
+    assert rejected.value.status_code == 429
+    assert 1 <= int(rejected.value.headers["Retry-After"]) <= 60
+
+
+@pytest.mark.anyio
+async def test_retry_after_header_is_never_zero():
+    class BoundaryBackend:
+        async def hit(self, *args):
+            return False, 0.0
+
+    limit = RateLimit("test_boundary", limit=1, window=60, backend=BoundaryBackend())
+
+    with pytest.raises(HTTPException) as rejected:
+        await limit(SimpleNamespace(client=SimpleNamespace(host="203.0.113.9")))
+
+    assert rejected.value.headers["Retry-After"] == "1"
+
+
+@pytest.mark.anyio
+async def test_dependency_fails_open_when_backend_errors():
+    class BrokenBackend:
+        async def hit(self, *args):
+            raise ConnectionError("rate limit store unavailable")
+
+    limit = RateLimit("test_broken", limit=1, window=60, backend=BrokenBackend())
+    request = SimpleNamespace(client=SimpleNamespace(host="203.0.113.9"))
+
+    await limit(request)
+    await limit(request)
@@ -0,0 +1,189 @@
+from datetime import datetime
+import gzip
+
+import pytest
+
+from compression import HAS_BROTLI
+from metrics import content_fallbacks_total
+from models import ExperienceCreate
+from responses import encoding_quality, etag_matches, negotiate_encoding, render_success
+
+BEST = "br" if HAS_BROTLI else "gzip"
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("", None),
+    ("identity", None),
+    ("gzip", "gzip"),
+    ("GZIP", "gzip"),
+    ("gzip, br", BEST),
+    ("*", BEST),
+    ("gzip;q=0", None),
+    ("gzip; q=0", None),
+    ("gzip;q=0, br;q=0", None),
+    ("*;q=0", None),
+    ("br;q=0.5, gzip", "gzip"),
+    ("gzip;q=0.2, br;q=0.9", BEST),
+    ("gzip;q=abc", None),
+    ("deflate", None),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+@pytest.mark.parametrize("header, quality", [
+    (None, 0.0),
+    ("gzip", 1.0),
+    ("gzip;q=0", 0.0),
+    ("br, *;q=0.3", 0.3),
+    ("deflate", 0.0),
+])
+def test_encoding_quality(header, quality):
+    assert encoding_quality(header, "gzip") == quality
+
+
+@pytest.mark.parametrize("header, matches", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", "abc"', True),
+    ("*", True),
+    ('"xyz"', False),
+    ('abc', False),
+    ("", False),
+])
+def test_etag_matches(header, matches):
+    assert etag_matches(header, '"abc"') is matches
+
+
+def test_each_encoding_has_its_own_strong_etag():
+    rendered = render_success({"a": 1}, "ok")
+
+    body, etag = rendered.encoded(None)
+    gzipped, gzip_etag = rendered.encoded("gzip")
+
+    assert etag.startswith('"') and not etag.startswith('W/')
+    assert gzip_etag == etag[:-1] + '-gz"'
+    assert gzip.decompress(gzipped) == body
+    assert rendered.encoded("gzip")[0] is gzipped
+    assert set(rendered.etags()) == {etag, gzip_etag}
+
+
+async def get(client, path="/api/portfolio", **headers):
+    return await client.get(path, headers={key.replace("_", "-"): value for key, value in headers.items()})
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("accept_encoding, encoding, suffix", [
+    ("identity", None, ""),
+    ("gzip", "gzip", "-gz"),
+    ("gzip;q=0", None, ""),
+    ("gzip;q=0, br;q=0", None, ""),
+    ("br;q=0.5, gzip", "gzip", "-gz"),
+    pytest.param("br", "br", "-br", marks=pytest.mark.skipif(not HAS_BROTLI, reason="brotli not installed")),
+])
+async def test_content_route_representations(client, accept_encoding, encoding, suffix):
+    identity = await get(client, accept_encoding="identity")
+    response = await get(client, accept_encoding=accept_encoding)
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == encoding
+    assert response.headers["etag"] == identity.headers["etag"][:-1] + suffix + '"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.content == identity.content
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip", "gzip;q=0"])
+@pytest.mark.parametrize("cached_as", ["identity", "gzip"])
+async def test_any_known_representation_revalidates(client, accept_encoding, cached_as):
+    first = await get(client, accept_encoding=cached_as)
+
+    response = await get(client, accept_encoding=accept_encoding, if_none_match=first.headers["etag"])
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == (await get(client, accept_encoding=accept_encoding)).headers["etag"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("if_none_match", ["*", "W/{etag}", '"stale", {etag}'])
+async def test_if_none_match_forms(client, if_none_match):
+    etag = (await get(client, accept_encoding="identity")).headers["etag"]
+
+    response = await get(client, accept_encoding="identity", if_none_match=if_none_match.format(etag=etag))
+
+    assert response.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_changed_content_gets_a_new_etag(client, db_manager):
+    before = await get(client, "/api/experience", accept_encoding="identity")
+
+    await db_manager.create_experience(ExperienceCreate(
+        company="Mycorrhiza Labs", position="Founder", duration="2020 - now", description="Truffle orchards"
+    ))
+    after = await get(client, "/api/experience", accept_encoding="identity", if_none_match=before.headers["etag"])
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert "Mycorrhiza Labs" in after.text
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("accept_encoding, encoding", [
+    ("gzip", "gzip"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("*", "gzip"),
+])
+async def test_dynamic_responses_honour_gzip_q_values(client, db_manager, accept_encoding, encoding):
+    await db_manager.db.contact_submissions.insert_many([{
+        "name": f"Sender {position}",
+        "email": f"sender{position}@example.com",
+        "subject": "Hello",
+        "message": "A message long enough to push the page over the gzip threshold.",
+        "inquiryType": "Other",
+        "status": "new",
+        "submittedAt": datetime(2024, 1, 1, 0, position)
+    } for position in range(20)])
+
+    response = await get(client, "/api/contact", accept_encoding=accept_encoding)
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == encoding
+    assert len(response.json()["items"]) == 20
+
+
+def fallbacks_served(section: str) -> float:
+    return content_fallbacks_total._values.get((section,), 0)
+
+
+@pytest.mark.anyio
+async def test_every_fallback_response_is_counted(client, db_manager):
+    before = {section: fallbacks_served(section) for section in ("profile", "experience", "testimonials", "expertise")}
+
+    # Rendered once, then served from the content cache and as a 304
+    first = await get(client, "/api/experience", accept_encoding="identity")
+    await get(client, "/api/experience", accept_encoding="identity")
+    await get(client, "/api/experience", accept_encoding="identity", if_none_match=first.headers["etag"])
+    await get(client, "/api/portfolio", accept_encoding="identity")
+
+    assert fallbacks_served("experience") - before["experience"] == 4
+    for section in ("profile", "testimonials", "expertise"):
+        assert fallbacks_served(section) - before[section] == 1
+
+
+@pytest.mark.anyio
+async def test_seeded_sections_are_not_counted_as_fallbacks(client, db_manager):
+    await db_manager.create_experience(ExperienceCreate(
+        company="Mycorrhiza Labs", position="Founder", duration="2020 - now", description="Truffle orchards"
+    ))
+    before = fallbacks_served("experience"), fallbacks_served("profile")
+
+    await get(client, "/api/experience", accept_encoding="identity")
+    await get(client, "/api/portfolio", accept_encoding="identity")
+
+    assert fallbacks_served("experience") == before[0]
+    assert fallbacks_served("profile") == before[1] + 1
@@ -0,0 +1,133 @@
+import pytest
+
+import routes
+from models import ContactSubmissionCreate
+from spam_filter import DuplicateSubmissionError, SpamFilter, SpamSubmissionError, fingerprint, repeated_text_ratio
+
+
+def make_submission(**fields) -> ContactSubmissionCreate:
+    return ContactSubmissionCreate(**{
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "subject": "Truffle orchard",
+        "message": "Looking for advice on inoculated seedlings.",
+        "inquiryType": "Other",
+        **fields
+    })
+
+
+def test_fingerprint_ignores_case_and_whitespace():
+    plain = make_submission()
+    noisy = make_submission(email="ADA@example.com", subject="  Truffle   orchard ",
+                            message="looking for advice on\ninoculated seedlings.")
+
+    assert fingerprint(plain) == fingerprint(noisy)
+    assert fingerprint(plain) != fingerprint(make_submission(subject="Truffle orchards"))
+
+
+def test_links_up_to_the_limit_are_accepted():
+    spam_filter = SpamFilter(max_links=3)
+    message = "See https://a.example, http://b.example and www.c.example for details."
+
+    assert spam_filter.check(make_submission(message=message))
+
+
+def test_too_many_links_are_rejected():
+    spam_filter = SpamFilter(max_links=3)
+    # Links in the subject count towards the same limit
+    submission = make_submission(
+        subject="Visit www.a.example",
+        message="See https://b.example, http://c.example and www.d.example today."
+    )
+
+    with pytest.raises(SpamSubmissionError, match="links"):
+        spam_filter.check(submission)
+
+
+def test_repeated_text_ratio():
+    assert repeated_text_ratio("") == 0.0
+    assert repeated_text_ratio("one two three four") == 0.0
+    assert repeated_text_ratio("buy buy buy buy") == 0.75
+
+
+def test_repeated_text_is_rejected():
+    spam_filter = SpamFilter(max_repeat_ratio=0.7, min_words_for_ratio=20)
+
+    with pytest.raises(SpamSubmissionError, match="repeated"):
+        spam_filter.check(make_submission(message=" ".join(["cheap truffles"] * 15)))
+
+
+def test_short_messages_are_exempt_from_the_repetition_check():
+    spam_filter = SpamFilter(max_repeat_ratio=0.7, min_words_for_ratio=20)
+    # 19 words, nearly all repeats, stays below min_words_for_ratio
+    short = " ".join(["thanks"] * 19)
+
+    assert spam_filter.check(make_submission(message=short))
+    with pytest.raises(SpamSubmissionError):
+        spam_filter.check(make_submission(message=" ".join(["thanks"] * 20)))
+
+
+def test_remembered_fingerprints_are_duplicates():
+    spam_filter = SpamFilter()
+    key = spam_filter.check(make_submission())
+    spam_filter.remember(key)
+
+    with pytest.raises(DuplicateSubmissionError):
+        spam_filter.check(make_submission())
+
+
+def test_checked_but_unremembered_submissions_are_not_duplicates():
+    spam_filter = SpamFilter()
+    spam_filter.check(make_submission())
+
+    assert spam_filter.check(make_submission())
+
+
+def test_least_recently_seen_fingerprint_is_evicted():
+    spam_filter = SpamFilter(max_entries=2)
+    first, second, third = (make_submission(subject=f"Truffle orchard {n}") for n in range(3))
+    for submission in (first, second):
+        spam_filter.remember(spam_filter.check(submission))
+
+    # A duplicate hit refreshes ``first``, so ``second`` is the oldest entry
+    with pytest.raises(DuplicateSubmissionError):
+        spam_filter.check(first)
+    spam_filter.remember(spam_filter.check(third))
+
+    assert len(spam_filter) == 2
+    assert spam_filter.check(second)
+    for submission in (first, third):
+        with pytest.raises(DuplicateSubmissionError):
+            spam_filter.check(submission)
+
+
+@pytest.fixture
+def route_filter(monkeypatch):
+    spam_filter = SpamFilter(max_links=1)
+    monkeypatch.setattr(routes, "spam_filter", spam_filter)
+    monkeypatch.setattr(routes.contact_rate_limit, "limit", 1000)
+    return spam_filter
+
+
+def payload(**fields) -> dict:
+    return make_submission(**fields).dict()
+
+
+@pytest.mark.anyio
+async def test_route_rejects_resubmissions_with_409(client, db_manager, route_filter):
+    first = await client.post("/api/contact", json=payload())
+    again = await client.post("/api/contact", json=payload(email="ADA@example.com"))
+
+    assert first.status_code == 200
+    assert again.status_code == 409
+    assert await db_manager.db.contact_submissions.count_documents({}) == 1
+
+
+@pytest.mark.anyio
+async def test_route_rejects_spam_with_400(client, db_manager, route_filter):
+    response = await client.post("/api/contact", json=payload(message="See www.a.example and www.b.example"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Your message could not be accepted."
+    assert await db_manager.db.contact_submissions.count_documents({}) == 0
+    assert len(route_filter) == 0